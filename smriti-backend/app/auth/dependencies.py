@@ -1,6 +1,6 @@
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+import jwt
 from app.config.settings import settings
 from app.database.connection import get_database
 from app.auth.schemas import UserResponse
@@ -19,7 +19,7 @@ async def get_current_user(token: str = Depends(oauth2_scheme), db = Depends(get
         user_id: str = payload.get("sub")
         if user_id is None:
             raise credentials_exception
-    except JWTError:
+    except jwt.PyJWTError:
         raise credentials_exception
         
     user = await db.users.find_one({"_id": ObjectId(user_id)})
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field, EmailStr, field_validator
+from pydantic import BaseModel, Field, EmailStr, field_validator, model_validator
 from typing import Optional, Dict, Any
 from datetime import datetime
 from bson import ObjectId
@@ -63,12 +63,20 @@ class UserResponse(UserBase):
     phone: Optional[str] = None
     timezone: Optional[str] = None
     location: Optional[LocationData] = None
+    location_required: Optional[bool] = None
     created_at: datetime = Field(alias="createdAt")
 
     class Config:
         populate_by_name = True
         json_encoders = {ObjectId: str}
 
+    @model_validator(mode='after')
+    def derive_location_required(self):
+        """Derive location_required for users written before the flag was stored"""
+        if self.location_required is None:
+            self.location_required = self.timezone is None or self.location is None
+        return self
+
 class AuthResponse(BaseModel):
     """Response model for auth endpoints matching API design"""
     user_id: str = Field(alias="userId")
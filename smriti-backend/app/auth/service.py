@@ -46,6 +46,8 @@ async def create_user(db, user: UserCreate):
     user_dict["created_at"] = get_current_timestamp()
     user_dict["email_verified"] = False
     user_dict["phone_verified"] = False
+    # New users have neither timezone nor location yet (Today's Quote)
+    user_dict["location_required"] = True
     
     new_user = await db.users.insert_one(user_dict)
     created_user = await db.users.find_one({"_id": new_user.inserted_id})
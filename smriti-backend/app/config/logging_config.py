@@ -1,10 +1,16 @@
 """
 Logging configuration for the application
 """
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from app.config.settings import settings
 
+# Background listener that owns the real (blocking) handlers
+_listener: QueueListener = None
+
 def setup_logging():
     """Configure application logging"""
     
@@ -31,13 +37,22 @@ def setup_logging():
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Remove existing handlers
+    # Remove existing handlers (and stop the listener from a previous setup)
+    global _listener
+    if _listener is not None:
+        _listener.stop()
     root_logger.handlers.clear()
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    
+    # Log calls only enqueue the record; a listener thread does the blocking
+    # write, so a slow stdout never stalls the event loop
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(QueueHandler(log_queue))
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
     
     # Reduce noise from third-party libraries
     logging.getLogger("uvicorn.access").setLevel(logging.WARNING)
@@ -49,6 +64,15 @@ def setup_logging():
     
     return root_logger
 
+
+def _stop_listener():
+    """Flush queued records on interpreter exit"""
+    if _listener is not None:
+        _listener.stop()
+
+
+atexit.register(_stop_listener)
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger instance for a module"""
     return logging.getLogger(name)
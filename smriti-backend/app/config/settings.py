@@ -1,3 +1,4 @@
+from pydantic import Field, ValidationInfo, field_validator
 from pydantic_settings import BaseSettings
 from functools import lru_cache
 from typing import Optional
@@ -16,11 +17,17 @@ class Settings(BaseSettings):
     # Database
     MONGODB_URI: str
     DATABASE_NAME: str = "smriti"
+    MONGODB_MAX_POOL_SIZE: int = 100
+    MONGODB_MIN_POOL_SIZE: int = 10
     
     # Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24 * 30  # 30 days
+    # bcrypt cost factor (2^rounds iterations). Calibrate so one hash takes
+    # roughly 250ms on production hardware; existing hashes keep their own cost.
+    # bcrypt accepts 4-31; anything below 10 is only allowed in tests
+    BCRYPT_ROUNDS: int = Field(12, ge=4, le=31)
     
     # Cloudinary
     CLOUDINARY_CLOUD_NAME: Optional[str] = None
@@ -34,6 +41,15 @@ class Settings(BaseSettings):
     # Cron Security
     CRON_SECRET: Optional[str] = None
     
+    @field_validator("BCRYPT_ROUNDS")
+    @classmethod
+    def validate_bcrypt_rounds(cls, v: int, info: ValidationInfo) -> int:
+        """Reject weak bcrypt costs outside the test environment"""
+        environment = (info.data.get("ENVIRONMENT") or "").lower()
+        if v < 10 and environment != "test":
+            raise ValueError("BCRYPT_ROUNDS must be at least 10 outside tests")
+        return v
+
     # Environment helpers
     @property
     def is_production(self) -> bool:
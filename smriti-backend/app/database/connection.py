@@ -1,21 +1,35 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
 from app.config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
 class Database:
+    """
+    Process-wide MongoDB client.
+
+    One client (and so one connection pool) is shared by every request on the
+    event loop. The database handle is created once on connect and reused,
+    rather than looked up on the client per request.
+    """
     client: AsyncIOMotorClient = None
+    _db: AsyncIOMotorDatabase = None
     
     def connect(self):
-        """Connect to MongoDB"""
+        """Connect to MongoDB (no-op if already connected)"""
+        if self.client is not None:
+            return
+
         self.client = AsyncIOMotorClient(
             settings.MONGODB_URI,
             serverSelectionTimeoutMS=60000,
             connectTimeoutMS=60000,
+            maxPoolSize=settings.MONGODB_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGODB_MIN_POOL_SIZE,
             tls=True,
             tlsAllowInvalidCertificates=True
         )
+        self._db = self.client[settings.DATABASE_NAME]
         logger.info(
             "Connected to MongoDB",
             extra={"database": settings.DATABASE_NAME}
@@ -25,11 +39,13 @@ class Database:
         """Close MongoDB connection"""
         if self.client:
             self.client.close()
+            self.client = None
+            self._db = None
             logger.info("Closed MongoDB connection")
             
     def get_db(self):
         """Get database instance"""
-        return self.client[settings.DATABASE_NAME]
+        return self._db
 
 db = Database()
 
@@ -4,7 +4,19 @@ Creates indexes for better query performance
 """
 from motor.motor_asyncio import AsyncIOMotorClient
 from app.config.settings import settings
-from app.quotes.constants import COLLECTION_NAME as QUOTES_COLLECTION
+from app.quotes.constants import (
+    COLLECTION_NAME as QUOTES_COLLECTION,
+    HISTORY_INDEX_NAME as QUOTES_HISTORY_INDEX,
+    HISTORY_INDEX_FILTER as QUOTES_HISTORY_FILTER,
+    LEGACY_HISTORY_INDEX_NAME as QUOTES_LEGACY_HISTORY_INDEX
+)
+
+
+async def _drop_legacy_quotes_history_index(db):
+    """Drop the (user_id, push_sent, day_key) history index, if still present"""
+    existing_indexes = await db[QUOTES_COLLECTION].index_information()
+    if QUOTES_LEGACY_HISTORY_INDEX in existing_indexes:
+        await db[QUOTES_COLLECTION].drop_index(QUOTES_LEGACY_HISTORY_INDEX)
 
 
 async def create_indexes():
@@ -23,7 +35,13 @@ async def create_indexes():
     # POSTS COLLECTION INDEXES
     # =========================================================================
     await db.posts.create_index([("created_at", -1)])  # For chronological sorting
-    await db.posts.create_index("author.user_id")
+    # A user's posts, newest first. Serves the profile page query (equality on
+    # author plus created_at sort, no in-memory sort) and its count_documents;
+    # the author.user_id prefix also covers plain lookups by author.
+    await db.posts.create_index(
+        [("author.user_id", 1), ("created_at", -1)],
+        name="author_created_at"
+    )
     await db.posts.create_index("content_type")
 
     # Text index for full-text search on title and text_content
@@ -69,11 +87,14 @@ async def create_indexes():
 
     # Index 3: For history query (user's past quotes, sorted by day)
     # Used for: GET /api/quotes/history
-    # Query: user_id = X AND push_sent = true, sorted by day_key desc
+    # Query: user_id = X AND push_sent = true AND quote_text is a string,
+    # sorted by day_key desc. Partial, so only delivered quotes are indexed.
     await db[QUOTES_COLLECTION].create_index(
-        [("user_id", 1), ("push_sent", 1), ("day_key", -1)],
-        name="user_history_lookup"
+        [("user_id", 1), ("day_key", -1)],
+        name=QUOTES_HISTORY_INDEX,
+        partialFilterExpression=QUOTES_HISTORY_FILTER
     )
+    await _drop_legacy_quotes_history_index(db)
     print("  ✓ User daily quotes indexes created")
 
     # =========================================================================
@@ -111,9 +132,11 @@ async def create_quotes_indexes_only():
     )
 
     await db[QUOTES_COLLECTION].create_index(
-        [("user_id", 1), ("push_sent", 1), ("day_key", -1)],
-        name="user_history_lookup"
+        [("user_id", 1), ("day_key", -1)],
+        name=QUOTES_HISTORY_INDEX,
+        partialFilterExpression=QUOTES_HISTORY_FILTER
     )
+    await _drop_legacy_quotes_history_index(db)
 
     print("✅ Quotes indexes created successfully")
     client.close()
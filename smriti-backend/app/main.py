@@ -11,6 +11,7 @@ from app.quotes.router import router as quotes_router, internal_router as quotes
 from app.circles.router import router as circles_router
 from app.middleware.cors import setup_cors
 from app.utils.logger import get_logger
+from app.utils.response_formatter import ORJSONResponse
 import logging
 
 # Setup logging
@@ -20,7 +21,8 @@ logger = get_logger(__name__)
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.VERSION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # CORS (Cross-Origin Resource Sharing) - using utility function
@@ -2,9 +2,8 @@
 Exception handlers for FastAPI application.
 """
 from fastapi import Request, HTTPException, status
-from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from app.utils.response_formatter import error_response
+from app.utils.response_formatter import ORJSONResponse, error_response
 from app.utils.logger import log_error
 
 
@@ -21,7 +20,7 @@ async def http_exception_handler(request: Request, exc: HTTPException):
     """
     # If detail is already a dict with our format, use it
     if isinstance(exc.detail, dict):
-        return JSONResponse(
+        return ORJSONResponse(
             status_code=exc.status_code,
             content=exc.detail
         )
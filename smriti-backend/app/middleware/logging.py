@@ -25,6 +25,10 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         # Calculate duration
         duration = time.time() - start_time
         
+        # Skip building the record entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return response
+        
         # Get user info if available (from auth)
         user_id = None
         if hasattr(request.state, "user"):
@@ -32,7 +36,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         
         # Log request
         logger.info(
-            f"{method} {path} - {response.status_code}",
+            "%s %s - %d", method, path, response.status_code,
             extra={
                 "method": method,
                 "path": path,
@@ -1,5 +1,5 @@
 from datetime import datetime
-from typing import List
+from typing import Dict, List
 
 class NotificationRepository:
     def __init__(self, db):
@@ -56,6 +56,44 @@ class NotificationRepository:
         tokens = await cursor.to_list(length=50)
         return [t["token"] for t in tokens if t.get("token")]
 
+    async def get_tokens_grouped_by_user(
+        self,
+        user_ids: List[str],
+        max_per_user: int = 50
+    ) -> Dict[str, List[str]]:
+        """
+        Get device tokens for multiple users in a single query, grouped by user.
+
+        Used by Today's Quote push sender so a cron tick costs one token
+        lookup instead of one per pending record.
+
+        Args:
+            user_ids: List of user IDs to get tokens for
+            max_per_user: Maximum tokens kept per user (same cap as get_tokens_for_user)
+
+        Returns:
+            Dict mapping user_id -> list of FCM token strings.
+            Users without tokens are absent from the dict.
+        """
+        if not user_ids:
+            return {}
+
+        cursor = self.collection.find(
+            {"user_id": {"$in": list(set(user_ids))}},
+            {"token": 1, "user_id": 1, "_id": 0}
+        )
+        tokens = await cursor.to_list(length=None)
+
+        tokens_by_user: Dict[str, List[str]] = {}
+        for t in tokens:
+            token = t.get("token")
+            if not token:
+                continue
+            user_tokens = tokens_by_user.setdefault(t["user_id"], [])
+            if len(user_tokens) < max_per_user:
+                user_tokens.append(token)
+        return tokens_by_user
+
     async def get_tokens_for_users(self, user_ids: List[str], exclude_user_id: str = None) -> List[str]:
         """
         Get device tokens for multiple users.
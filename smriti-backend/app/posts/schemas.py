@@ -95,3 +95,30 @@ class PostResponse(PostInDB):
     class Config:
         populate_by_name = True
         json_encoders = {ObjectId: str}
+
+
+def build_post_response(post: dict) -> PostResponse:
+    """
+    Build a PostResponse from a post document read from the database.
+
+    Documents were validated when they were written, so this skips pydantic
+    validation via model_construct. The nested author and enum fields are
+    still built as their proper types so serialization output is unchanged.
+
+    The document is converted in place rather than copied. The conversion is
+    idempotent, so passing an already-converted document is harmless.
+
+    Args:
+        post: Post document from the posts collection
+
+    Returns:
+        PostResponse instance
+    """
+    post["_id"] = str(post["_id"])
+    if isinstance(post["author"], dict):
+        post["author"] = AuthorSchema.model_construct(**post["author"])
+    if "content_type" in post:
+        post["content_type"] = ContentType(post["content_type"])
+    if post.get("visibility") is not None:
+        post["visibility"] = Visibility(post["visibility"])
+    return PostResponse.model_construct(**post)
@@ -4,7 +4,8 @@ from typing import Optional, List, Tuple
 from bson import ObjectId
 from app.posts.schemas import PostCreate, PostInDB, Visibility
 from app.utils.cloudinary import delete_file
-from app.utils.cache import cache
+from app.users.cache import invalidate_profile_cache
+from app.utils.cache import cache, SimpleCache
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
@@ -12,6 +13,13 @@ logger = get_logger(__name__)
 SEARCH_CACHE_PREFIX = "search:"
 SEARCH_CACHE_TTL = 300  # 5 minutes
 
+POST_COUNT_CACHE_PREFIX = "user_posts_count:"
+POST_COUNT_CACHE_TTL = 30  # seconds
+
+# Per-user post counters. Separate from the search cache, which is cleared
+# wholesale whenever a post is created.
+_post_count_cache = SimpleCache()
+
 
 # =============================================================================
 # CIRCLE POST EXCEPTIONS
@@ -72,6 +80,9 @@ async def create_post_db(db, post_dict: dict, current_user=None):
 
     # 2. Invalidate search cache since new content is available
     _clear_search_cache()
+    author = post_dict.get("author")
+    if author:
+        _adjust_post_count(author["user_id"], 1)
 
     # 3. Send notifications (fire-and-forget, don't block response)
     if current_user:
@@ -304,14 +315,52 @@ async def get_post_by_id(db, post_id: str):
     return await db.posts.find_one({"_id": ObjectId(post_id)})
 
 async def delete_post_db(db, post_id: str):
-    await db.posts.delete_one({"_id": ObjectId(post_id)})
-
-async def get_posts_by_user(db, user_id: str, skip: int, limit: int):
-    cursor = db.posts.find({"author.user_id": user_id}).sort("created_at", -1).skip(skip).limit(limit)
+    deleted = await db.posts.find_one_and_delete(
+        {"_id": ObjectId(post_id)},
+        projection={"author.user_id": 1}
+    )
+    if deleted:
+        _adjust_post_count(deleted["author"]["user_id"], -1)
+
+async def get_posts_by_user(db, user_id: str, skip: int, limit: int, before: Optional[datetime] = None):
+    query = {"author.user_id": user_id}
+    if before is not None:
+        # Keyset pagination: seek on the (author.user_id, created_at) index
+        # instead of walking past `skip` entries
+        query["created_at"] = {"$lt": before}
+
+    # batch_size=limit returns the whole page in the first batch (no getMore)
+    cursor = db.posts.find(query).sort("created_at", -1).limit(limit).batch_size(limit)
+    if skip:
+        cursor = cursor.skip(skip)
     return await cursor.to_list(length=limit)
 
 async def count_posts_by_user(db, user_id: str):
-    return await db.posts.count_documents({"author.user_id": user_id})
+    cache_key = f"{POST_COUNT_CACHE_PREFIX}{user_id}"
+    cached_count = _post_count_cache.get(cache_key)
+    if cached_count is not None:
+        return cached_count
+
+    count = await db.posts.count_documents({"author.user_id": user_id})
+    _post_count_cache.set(cache_key, count, POST_COUNT_CACHE_TTL)
+    return count
+
+
+def _adjust_post_count(user_id: str, delta: int):
+    """
+    Apply a post create/delete to the user's cached post count.
+
+    Updates the cached count in place when present, keeping its original
+    expiry so the counter is still recounted within POST_COUNT_CACHE_TTL.
+    A miss is simply recounted on next read. Also drops the user's cached
+    profiles, which embed the count.
+    """
+    cache_key = f"{POST_COUNT_CACHE_PREFIX}{user_id}"
+    cached_count = _post_count_cache.get(cache_key)
+    if cached_count is not None:
+        _post_count_cache.replace(cache_key, max(0, cached_count + delta))
+
+    invalidate_profile_cache(user_id)
 
 
 def _build_search_cache_key(
@@ -48,6 +48,10 @@ RESCHEDULE_MAX_MINUTES = 60
 # Maximum devices per user to send push notifications to
 MAX_DEVICES_PER_USER = 50
 
+# Number of sent records the push sender accumulates before flushing them
+# to the database in one bulk write
+MARK_SENT_BATCH_SIZE = 500
+
 
 # =============================================================================
 # HISTORY
@@ -80,3 +84,16 @@ PUSH_DATA_TYPE = "today_quote"
 
 # MongoDB collection name for daily quotes
 COLLECTION_NAME = "user_daily_quotes"
+
+# Partial index serving history queries. It only holds delivered quotes, so a
+# page of history is an index range scan regardless of how many pending or
+# empty days a user has accumulated.
+HISTORY_INDEX_NAME = "user_history_partial"
+HISTORY_INDEX_FILTER = {
+    "push_sent": True,
+    "quote_text": {"$type": "string"}
+}
+
+# (user_id, push_sent, day_key) index the partial history index replaced;
+# dropped by the index setup scripts so writes stop maintaining both
+LEGACY_HISTORY_INDEX_NAME = "user_history_lookup"
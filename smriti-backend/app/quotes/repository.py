@@ -8,15 +8,30 @@ from datetime import datetime
 from typing import Optional, List, Tuple
 from zoneinfo import ZoneInfo
 from bson import ObjectId
-from pymongo import ReturnDocument
+from pymongo import ReturnDocument, UpdateOne
 
 from app.database.connection import get_database
 from app.quotes.constants import (
     COLLECTION_NAME,
     DEFAULT_HISTORY_LIMIT,
-    MAX_HISTORY_LIMIT
+    MAX_HISTORY_LIMIT,
+    HISTORY_INDEX_NAME,
+    HISTORY_INDEX_FILTER,
+    LEGACY_HISTORY_INDEX_NAME
 )
 
+# Fields read by build_quote_history_item
+HISTORY_PROJECTION = {
+    "_id": 0,
+    "quote_text": 1,
+    "source_author_user_id": 1,
+    "source_author_username": 1,
+    "source_post_id": 1,
+    "day_key": 1,
+    "push_sent_at_utc": 1,
+    "created_at_utc": 1
+}
+
 
 # =============================================================================
 # SINGLE DOCUMENT OPERATIONS
@@ -160,6 +175,48 @@ async def mark_quote_sent(
     return result.modified_count > 0
 
 
+async def mark_quotes_sent_bulk(sent_records: List[dict]) -> int:
+    """
+    Mark many daily quote records as sent in a single bulk write.
+
+    Used by the push sender cron job, which collects the results of a batch of
+    records and flushes them together instead of issuing one update per record.
+
+    Args:
+        sent_records: List of dicts with the same keys as mark_quote_sent's
+            arguments (record_id, quote_text, and optional source_* fields)
+
+    Returns:
+        Number of documents modified
+    """
+    if not sent_records:
+        return 0
+
+    db = get_database()
+    now_utc = datetime.now(ZoneInfo("UTC"))
+
+    operations = [
+        UpdateOne(
+            {"_id": ObjectId(record["record_id"])},
+            {
+                "$set": {
+                    "push_sent": True,
+                    "push_sent_at_utc": now_utc,
+                    "quote_text": record.get("quote_text"),
+                    "source_post_id": record.get("source_post_id"),
+                    "source_author_user_id": record.get("source_author_user_id"),
+                    "source_author_username": record.get("source_author_username"),
+                    "updated_at_utc": now_utc
+                }
+            }
+        )
+        for record in sent_records
+    ]
+
+    result = await db[COLLECTION_NAME].bulk_write(operations, ordered=False)
+    return result.modified_count
+
+
 async def mark_quote_sent_by_user_day(
     user_id: str,
     day_key: str,
@@ -242,9 +299,10 @@ async def get_quote_history(
 
     Only returns records where:
     - push_sent = true
-    - quote_text is not null (skips days with no available quote)
+    - quote_text is set (skips days with no available quote)
 
-    Results are sorted by day_key descending (newest first).
+    Results are sorted by day_key descending (newest first). The filter
+    matches the partial history index, so the planner can serve it from there.
 
     Args:
         user_id: User's ObjectId as string
@@ -259,17 +317,15 @@ async def get_quote_history(
     # Clamp limit to max
     limit = min(limit, MAX_HISTORY_LIMIT)
 
-    query = {
-        "user_id": user_id,
-        "push_sent": True,
-        "quote_text": {"$ne": None}
-    }
+    # Repeats HISTORY_INDEX_FILTER so the planner can pick the partial index.
+    # No hint: a hint naming an index that was never built fails the query.
+    query = {"user_id": user_id, **HISTORY_INDEX_FILTER}
 
     # Get total count
     total = await db[COLLECTION_NAME].count_documents(query)
 
     # Get paginated results
-    cursor = db[COLLECTION_NAME].find(query)\
+    cursor = db[COLLECTION_NAME].find(query, HISTORY_PROJECTION)\
         .sort("day_key", -1)\
         .skip(skip)\
         .limit(limit)
@@ -364,7 +420,7 @@ async def setup_indexes() -> None:
     Indexes:
     1. (user_id, day_key) - unique: Primary lookup, ensures one quote per user per day
     2. (push_sent, scheduled_push_time_utc): For cron job to find pending pushes
-    3. (user_id, push_sent, day_key): For history queries
+    3. (user_id, day_key), partial on delivered quotes: For history queries
     """
     db = get_database()
     collection = db[COLLECTION_NAME]
@@ -384,10 +440,15 @@ async def setup_indexes() -> None:
 
     # Index 3: For history query (user's past quotes, sorted by day)
     await collection.create_index(
-        [("user_id", 1), ("push_sent", 1), ("day_key", -1)],
-        name="user_history_lookup"
+        [("user_id", 1), ("day_key", -1)],
+        name=HISTORY_INDEX_NAME,
+        partialFilterExpression=HISTORY_INDEX_FILTER
     )
 
+    # Migration: drop the history index the partial one replaced
+    if LEGACY_HISTORY_INDEX_NAME in await collection.index_information():
+        await collection.drop_index(LEGACY_HISTORY_INDEX_NAME)
+
 
 # =============================================================================
 # CLEANUP OPERATIONS (for maintenance)
@@ -10,9 +10,12 @@ This module contains the core service functions for:
 import random
 import logging
 from datetime import datetime, timedelta
+from types import MappingProxyType
 from typing import Optional, Tuple, List
 from zoneinfo import ZoneInfo
 
+from pymongo.errors import BulkWriteError
+
 from app.database.connection import get_database
 from app.quotes import repository
 from app.quotes.extraction import pick_random_quote
@@ -26,12 +29,39 @@ from app.quotes.schemas import (
     build_today_quote_response,
     build_quote_history_item
 )
-from app.quotes.constants import DEFAULT_HISTORY_LIMIT
+from app.quotes.constants import DEFAULT_HISTORY_LIMIT, MARK_SENT_BATCH_SIZE
 from app.notifications.repository import NotificationRepository
+from app.utils.cache import SimpleCache
 from app.utils.firebase import send_push_notification
 
 logger = logging.getLogger(__name__)
 
+# Responses for the non-delivered states carry no per-user data, so they are
+# built once at import time and shared by every request. Treat as read-only.
+_PENDING_SOON_RESPONSE = build_today_quote_response(
+    has_quote=False,
+    status=QuoteStatus.PENDING,
+    message="Your quote will arrive soon"
+)
+_PENDING_LATER_RESPONSE = build_today_quote_response(
+    has_quote=False,
+    status=QuoteStatus.PENDING,
+    message="Your quote will arrive later today"
+)
+_UNAVAILABLE_RESPONSE = build_today_quote_response(
+    has_quote=False,
+    status=QuoteStatus.UNAVAILABLE,
+    message="No quote available today"
+)
+
+# Delivered quotes are final for the rest of the user's day, so they are cached
+# per process until the next sunrise. Keyed by user only (the day_key is checked
+# on read) so the cache never holds more than one entry per user.
+_today_quote_cache = SimpleCache()
+
+# Shared read-only stand-in for users without a stored location
+_EMPTY_LOCATION = MappingProxyType({})
+
 
 # =============================================================================
 # USER-FACING SERVICES
@@ -67,39 +97,31 @@ async def get_today_quote(
     )
     day_key = sunrise_info["day_key"]
 
+    cached = _today_quote_cache.get(user_id)
+    if cached is not None and cached.quote.day_key == day_key:
+        return cached
+
     # Check if record exists for today
     record = await repository.get_quote_for_user_day(user_id, day_key)
 
     if not record:
         # No record for today - this shouldn't happen normally
         # (cron job should have created it), but handle gracefully
-        return build_today_quote_response(
-            has_quote=False,
-            status=QuoteStatus.PENDING,
-            message="Your quote will arrive soon"
-        )
+        return _PENDING_SOON_RESPONSE
 
     if not record.get("push_sent"):
         # Quote scheduled but not yet sent
-        return build_today_quote_response(
-            has_quote=False,
-            status=QuoteStatus.PENDING,
-            message="Your quote will arrive later today"
-        )
+        return _PENDING_LATER_RESPONSE
 
     # Push has been sent
     quote_text = record.get("quote_text")
 
     if not quote_text:
         # Push was marked sent but no quote (no usable posts)
-        return build_today_quote_response(
-            has_quote=False,
-            status=QuoteStatus.UNAVAILABLE,
-            message="No quote available today"
-        )
+        return _UNAVAILABLE_RESPONSE
 
     # Quote is available
-    return build_today_quote_response(
+    response = build_today_quote_response(
         has_quote=True,
         status=QuoteStatus.DELIVERED,
         quote_data={
@@ -112,6 +134,14 @@ async def get_today_quote(
         }
     )
 
+    ttl_seconds = int(
+        (sunrise_info["next_sunrise_utc"] - datetime.now(ZoneInfo("UTC"))).total_seconds()
+    )
+    if ttl_seconds > 0:
+        _today_quote_cache.set(user_id, response, ttl_seconds)
+
+    return response
+
 
 async def get_quote_history(
     user_id: str,
@@ -185,9 +215,9 @@ async def initialize_daily_quotes() -> CronInitResponse:
             user_timezone = user.get("timezone")
 
             # Get location if available
-            location = user.get("location", {})
-            user_lat = location.get("latitude") if location else None
-            user_lng = location.get("longitude") if location else None
+            location = user.get("location") or _EMPTY_LOCATION
+            user_lat = location.get("latitude")
+            user_lng = location.get("longitude")
 
             # Get sunrise info for this user
             sunrise_info = get_sunrise_info_for_user(
@@ -239,11 +269,15 @@ async def send_pending_pushes() -> CronPushResponse:
     """
     Cron Job 2: Send pending push notifications.
 
-    This should run every 5-10 minutes. For each pending record:
-    1. Check if scheduled time has passed
-    2. Pick a random quote from posts
-    3. Send push notification to user's devices
-    4. Mark record as sent
+    This should run every 5-10 minutes. Pending records are handled in
+    batches of MARK_SENT_BATCH_SIZE:
+    1. Pick a random quote for each record in the batch
+    2. Mark the whole batch as sent in one bulk write
+    3. Send push notifications for the records that were written
+
+    Records are persisted before any push goes out, so a failed write or a
+    crash can at worst skip a push; it never lets the next run push the same
+    quote again.
 
     Returns:
         CronPushResponse with counts of processed/sent/errored records
@@ -264,32 +298,56 @@ async def send_pending_pushes() -> CronPushResponse:
 
     logger.info(f"Push sender: Processing {len(pending_records)} pending records")
 
-    for record in pending_records:
-        processed_count += 1
-        record_id = str(record["_id"])
-        user_id = record["user_id"]
+    # Fetch device tokens for every pending user in one query
+    tokens_by_user = await notification_repo.get_tokens_grouped_by_user(
+        [record["user_id"] for record in pending_records]
+    )
 
-        try:
-            # Pick a random quote
-            quote_data = await pick_random_quote()
+    for start in range(0, len(pending_records), MARK_SENT_BATCH_SIZE):
+        batch = []
+
+        for record in pending_records[start:start + MARK_SENT_BATCH_SIZE]:
+            processed_count += 1
+            record_id = str(record["_id"])
+
+            try:
+                # Pick a random quote
+                quote_data = await pick_random_quote()
+            except Exception as e:
+                logger.error(f"Error processing record {record_id}: {e}")
+                error_count += 1
+                continue
 
             if not quote_data:
                 # No usable posts - mark as sent with no quote
-                await repository.mark_quote_sent(record_id, None)
+                batch.append({"sent": {"record_id": record_id, "quote_text": None}})
+                continue
+
+            batch.append({
+                "sent": {
+                    "record_id": record_id,
+                    "quote_text": quote_data["quote_text"],
+                    "source_post_id": quote_data.get("post_id"),
+                    "source_author_user_id": quote_data.get("author_user_id"),
+                    "source_author_username": quote_data.get("author_username")
+                },
+                "user_id": record["user_id"],
+                "day_key": record["day_key"]
+            })
+
+        # Persist the batch first; only records that were written get a push
+        written = await _write_sent_batch(batch)
+        error_count += len(batch) - len(written)
+
+        for entry in written:
+            sent = entry["sent"]
+
+            if sent["quote_text"] is None:
                 no_quote_count += 1
                 continue
 
             # Get user's device tokens
-            tokens = await notification_repo.get_tokens_for_user(user_id)
-
-            # Save quote data regardless of push
-            await repository.mark_quote_sent(
-                record_id=record_id,
-                quote_text=quote_data["quote_text"],
-                source_post_id=quote_data.get("post_id"),
-                source_author_user_id=quote_data.get("author_user_id"),
-                source_author_username=quote_data.get("author_username")
-            )
+            tokens = tokens_by_user.get(entry["user_id"], [])
 
             if not tokens:
                 # Quote saved but no devices to push to
@@ -299,20 +357,16 @@ async def send_pending_pushes() -> CronPushResponse:
             # Send push notification
             push_sent = _send_quote_push(
                 tokens=tokens,
-                quote_text=quote_data["quote_text"],
-                post_id=quote_data.get("post_id"),
-                day_key=record["day_key"]
+                quote_text=sent["quote_text"],
+                post_id=sent.get("source_post_id"),
+                day_key=entry["day_key"]
             )
 
             if push_sent:
                 sent_count += 1
             else:
                 # Push failed but quote is saved, user can still see it in app
-                logger.warning(f"Push failed for user {user_id} but quote saved")
-
-        except Exception as e:
-            logger.error(f"Error processing record {record_id}: {e}")
-            error_count += 1
+                logger.warning(f"Push failed for user {entry['user_id']} but quote saved")
 
     logger.info(
         f"Push sender complete: processed={processed_count}, sent={sent_count}, "
@@ -378,6 +432,33 @@ def _generate_random_push_time(
     return earliest + timedelta(seconds=random_offset)
 
 
+async def _write_sent_batch(batch: List[dict]) -> List[dict]:
+    """
+    Mark a batch of records as sent in one bulk write.
+
+    Args:
+        batch: Entries built by send_pending_pushes; entry["sent"] holds the
+            fields for repository.mark_quotes_sent_bulk
+
+    Returns:
+        The entries whose records were written (empty if the write failed)
+    """
+    if not batch:
+        return []
+
+    try:
+        await repository.mark_quotes_sent_bulk([entry["sent"] for entry in batch])
+        return batch
+    except BulkWriteError as e:
+        # Unordered bulk write: every operation not listed as an error applied
+        failed = {error["index"] for error in e.details.get("writeErrors", [])}
+        logger.error(f"Error marking {len(failed)} of {len(batch)} records as sent: {e}")
+        return [entry for index, entry in enumerate(batch) if index not in failed]
+    except Exception as e:
+        logger.error(f"Error marking {len(batch)} records as sent: {e}")
+        return []
+
+
 def _send_quote_push(
     tokens: List[str],
     quote_text: str,
@@ -0,0 +1,23 @@
+"""
+In-process cache for user profiles.
+
+Kept out of the users service so the posts service can invalidate profiles
+(which embed the post count) without importing the users service.
+"""
+from app.utils.cache import SimpleCache
+
+PROFILE_CACHE_PREFIX = "user_profile:"
+OWN_PROFILE_CACHE_PREFIX = "user_profile_me:"
+PROFILE_CACHE_TTL = 60  # 1 minute
+
+# Profiles are read on nearly every page load. Kept separate from the shared
+# search cache so search invalidation does not flush profiles. The cache is
+# in-process and holds the profile dicts themselves, so hits pay no encode or
+# decode cost; cached dicts are shared and must not be mutated by callers.
+_profile_cache = SimpleCache()
+
+
+def invalidate_profile_cache(user_id: str):
+    """Drop cached public and own-profile data for a user."""
+    _profile_cache.delete(f"{PROFILE_CACHE_PREFIX}{user_id}")
+    _profile_cache.delete(f"{OWN_PROFILE_CACHE_PREFIX}{user_id}")
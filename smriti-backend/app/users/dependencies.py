@@ -0,0 +1,39 @@
+"""
+Dependencies for the users module.
+
+This module provides FastAPI dependencies for path parameter validation.
+"""
+
+from bson import ObjectId
+from bson.errors import InvalidId
+from fastapi import HTTPException
+
+
+def valid_user_id(user_id: str) -> ObjectId:
+    """
+    Parse the user_id path parameter into an ObjectId.
+
+    The hex string is parsed once here and the resulting ObjectId is passed
+    through the service layer, so services never re-validate or re-parse it.
+
+    Args:
+        user_id: User ID from the request path
+
+    Returns:
+        ObjectId: Parsed user ID
+
+    Raises:
+        HTTPException 400: If user_id is not a valid ObjectId
+
+    Usage:
+        @router.get("/{user_id}")
+        async def endpoint(user_oid: ObjectId = Depends(valid_user_id)):
+            ...
+    """
+    try:
+        return ObjectId(user_id)
+    except (InvalidId, TypeError):
+        raise HTTPException(
+            status_code=400,
+            detail={"success": False, "error": "Invalid user ID format"}
+        )
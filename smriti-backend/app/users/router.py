@@ -1,3 +1,6 @@
+import asyncio
+from datetime import datetime
+from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException, Query
 from bson import ObjectId
 from pydantic import ValidationError
@@ -6,9 +9,10 @@ from app.auth.dependencies import get_current_user
 from app.auth.schemas import UserResponse
 from app.utils.response_formatter import success_response, error_response
 from app.users import service
+from app.users.dependencies import valid_user_id
 from app.users.schemas import UserProfileResponse, UserUpdate, UserUpdateResponse
 from app.posts import service as posts_service
-from app.posts.schemas import PostResponse
+from app.posts.schemas import build_post_response
 
 router = APIRouter()
 
@@ -68,18 +72,12 @@ async def update_current_user_profile(
 
 @router.get("/{user_id}", response_model=dict)
 async def get_user_profile(
-    user_id: str,
+    user_oid: ObjectId = Depends(valid_user_id),
     db = Depends(get_database),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """Get a user's public profile by user_id"""
-    if not ObjectId.is_valid(user_id):
-        raise HTTPException(
-            status_code=400,
-            detail={"success": False, "error": "Invalid user ID format"}
-        )
-
-    profile = await service.get_user_profile_by_id(db, user_id)
+    profile = await service.get_user_profile_by_id(db, user_oid)
     if not profile:
         raise HTTPException(
             status_code=404,
@@ -97,33 +95,30 @@ async def get_user_posts(
     user_id: str,
     skip: int = Query(0, ge=0, description="Number of posts to skip"),
     limit: int = Query(20, gt=0, le=100, description="Max posts to return"),
+    before: Optional[datetime] = Query(
+        None,
+        description="Only return posts created before this time (created_at of the last post already loaded)"
+    ),
+    user_oid: ObjectId = Depends(valid_user_id),
     db = Depends(get_database),
     current_user: UserResponse = Depends(get_current_user)
 ):
     """Get posts by a specific user"""
-    if not ObjectId.is_valid(user_id):
-        raise HTTPException(
-            status_code=400,
-            detail={"success": False, "error": "Invalid user ID format"}
-        )
-
-    # Verify user exists
-    user = await service.get_user_by_id(db, user_id)
+    # Verify user exists while fetching the page and total concurrently
+    user, posts, total = await asyncio.gather(
+        service.get_user_by_id_for_profile(db, user_oid),
+        posts_service.get_posts_by_user(db, user_id, skip, limit, before),
+        posts_service.count_posts_by_user(db, user_id)
+    )
     if not user:
         raise HTTPException(
             status_code=404,
             detail={"success": False, "error": "User not found"}
         )
 
-    posts = await posts_service.get_posts_by_user(db, user_id, skip, limit)
-    total = await posts_service.count_posts_by_user(db, user_id)
-
     return success_response(
         data={
-            "posts": [
-                PostResponse(**{**post, "_id": str(post["_id"])})
-                for post in posts
-            ],
+            "posts": [build_post_response(post) for post in posts],
             "total": total,
             "skip": skip,
             "limit": limit
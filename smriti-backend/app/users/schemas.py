@@ -1,9 +1,20 @@
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
+from functools import lru_cache
 from typing import Optional
 from datetime import datetime
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
 
+@lru_cache(maxsize=512)
+def _is_valid_timezone(name: str) -> bool:
+    """Check a timezone key, caching the result (including failures)."""
+    try:
+        ZoneInfo(name)
+    except (ZoneInfoNotFoundError, KeyError, ValueError):
+        return False
+    return True
+
+
 class LocationData(BaseModel):
     """User location coordinates"""
     latitude: float = Field(..., ge=-90, le=90)
@@ -23,8 +34,7 @@ class UserProfileResponse(BaseModel):
     joined_at: datetime
     post_count: int
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
 
 
 class UserUpdate(BaseModel):
@@ -53,11 +63,8 @@ class UserUpdate(BaseModel):
         if v is None:
             return None
 
-        # Try to instantiate the timezone to verify it's valid
-        # This works on all platforms (Windows, Linux, macOS)
-        try:
-            ZoneInfo(v)
-        except (ZoneInfoNotFoundError, KeyError):
+        # Works on all platforms (Windows, Linux, macOS) via tzdata
+        if not _is_valid_timezone(v):
             raise ValueError(
                 f"Invalid timezone: '{v}'. Must be a valid IANA timezone "
                 f"(e.g., 'America/New_York', 'Europe/London', 'Asia/Kolkata')"
@@ -85,22 +92,22 @@ class UserUpdate(BaseModel):
             "You cannot update only one coordinate."
         )
 
-    def has_updates(self) -> bool:
-        """Check if any fields have values to update"""
-        return any([
-            self.timezone is not None,
-            self.latitude is not None,
-            self.longitude is not None
-        ])
-
     def to_db_update(self) -> dict:
-        """Convert to database update dict, only including non-None fields"""
+        """
+        Convert to database update dict in a single pass.
+
+        Only fields the client actually sent (model_fields_set) are
+        considered, and explicit nulls are ignored. An empty dict means
+        there is nothing to update.
+        """
+        fields_set = self.model_fields_set
         update = {}
 
-        if self.timezone is not None:
+        if "timezone" in fields_set and self.timezone is not None:
             update["timezone"] = self.timezone
 
-        if self.latitude is not None and self.longitude is not None:
+        # validate_location_pair guarantees both or neither are non-None
+        if "latitude" in fields_set and self.latitude is not None:
             update["location"] = {
                 "latitude": self.latitude,
                 "longitude": self.longitude
@@ -123,5 +130,4 @@ class UserUpdateResponse(BaseModel):
         description="True if user should be prompted to set location"
     )
 
-    class Config:
-        populate_by_name = True
+    model_config = ConfigDict(populate_by_name=True)
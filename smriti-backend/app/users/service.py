@@ -1,52 +1,114 @@
-from datetime import datetime, timezone
 from bson import ObjectId
+from pymongo import ReturnDocument
 from app.auth.schemas import UserResponse
 from app.posts import service as posts_service
 from app.users.schemas import UserUpdate, UserUpdateResponse, LocationData
-
-
-async def get_user_by_id(db, user_id: str) -> dict:
+from app.users.cache import (
+    OWN_PROFILE_CACHE_PREFIX,
+    PROFILE_CACHE_PREFIX,
+    PROFILE_CACHE_TTL,
+    _profile_cache,
+    invalidate_profile_cache,
+)
+from app.utils.date_helpers import get_current_timestamp
+
+# User fields needed to build profile and update responses (never credentials)
+PROFILE_PROJECTION = {
+    "username": 1,
+    "display_name": 1,
+    "email": 1,
+    "phone": 1,
+    "timezone": 1,
+    "location": 1,
+    "created_at": 1,
+    "createdAt": 1,
+    "updated_at": 1,
+    "location_required": 1
+}
+
+# Recomputes the stored location_required flag from the document's own
+# timezone/location inside an update pipeline ($ifNull folds missing to null)
+LOCATION_REQUIRED_EXPR = {
+    "$or": [
+        {"$eq": [{"$ifNull": ["$timezone", None]}, None]},
+        {"$eq": [{"$ifNull": ["$location", None]}, None]}
+    ]
+}
+
+async def get_user_by_id_for_profile(db, user_oid: ObjectId) -> dict:
     """
-    Get a user by their ObjectId string.
+    Get the profile fields of a user by their ObjectId.
+
+    Credentials and other unused fields are projected away.
 
     Args:
         db: Database connection
-        user_id: User's ObjectId as string
+        user_oid: User's ObjectId (parsed by the caller)
 
     Returns:
-        dict: User document or None if not found
+        dict: Projected user document or None if not found
     """
-    if not ObjectId.is_valid(user_id):
-        return None
-    user = await db.users.find_one({"_id": ObjectId(user_id)})
-    return user
+    return await db.users.find_one({"_id": user_oid}, PROFILE_PROJECTION)
 
 
-async def get_user_profile_by_id(db, user_id: str) -> dict:
+async def get_user_profile_by_id(db, user_oid: ObjectId) -> dict:
     """
     Get a public user profile by user_id with statistics.
 
     Args:
         db: Database connection
-        user_id: User's ObjectId as string
+        user_oid: User's ObjectId (parsed by the caller)
 
     Returns:
         dict: Public profile data with post_count, or None if not found
     """
-    user = await get_user_by_id(db, user_id)
-    if not user:
+    cache_key = f"{PROFILE_CACHE_PREFIX}{user_oid}"
+    cached_profile = _profile_cache.get(cache_key)
+    if cached_profile is not None:
+        return cached_profile
+
+    # Fetch the user and count their posts in one round trip
+    pipeline = [
+        {"$match": {"_id": user_oid}},
+        {
+            "$lookup": {
+                "from": "posts",
+                "let": {"uid": {"$toString": "$_id"}},
+                "pipeline": [
+                    {"$match": {"$expr": {"$eq": ["$author.user_id", "$$uid"]}}},
+                    {"$count": "n"}
+                ],
+                "as": "post_counts"
+            }
+        },
+        {
+            "$project": {
+                "username": 1,
+                "display_name": 1,
+                "created_at": 1,
+                "createdAt": 1,
+                "post_count": {
+                    "$ifNull": [{"$arrayElemAt": ["$post_counts.n", 0]}, 0]
+                }
+            }
+        }
+    ]
+    results = await db.users.aggregate(pipeline).to_list(length=1)
+    if not results:
         return None
+    user = results[0]
 
-    post_count = await posts_service.count_posts_by_user(db, user_id)
-
-    return {
+    profile = {
         "id": str(user["_id"]),
         "username": user.get("username"),
         "display_name": user.get("display_name"),
         "joined_at": user.get("created_at") or user.get("createdAt"),
-        "post_count": post_count
+        "post_count": user["post_count"]
     }
 
+    _profile_cache.set(cache_key, profile, PROFILE_CACHE_TTL)
+    return profile
+
 
 async def get_user_profile_with_stats(db, user: UserResponse) -> dict:
     """
@@ -59,12 +121,14 @@ async def get_user_profile_with_stats(db, user: UserResponse) -> dict:
     Returns:
         dict: User profile data with post_count and other stats
     """
+    cache_key = f"{OWN_PROFILE_CACHE_PREFIX}{user.id}"
+    cached_profile = _profile_cache.get(cache_key)
+    if cached_profile is not None:
+        return cached_profile
+
     # Count user's posts
     post_count = await posts_service.count_posts_by_user(db, str(user.id))
 
-    # Determine if location is required (for Today's Quote feature)
-    location_required = user.timezone is None or user.location is None
-
     # Build profile data
     profile_data = {
         "id": str(user.id),
@@ -73,12 +137,16 @@ async def get_user_profile_with_stats(db, user: UserResponse) -> dict:
         "email": user.email,
         "phone": user.phone,
         "timezone": user.timezone,
-        "location": user.location.model_dump() if user.location else None,
-        "location_required": location_required,
+        "location": {
+            "latitude": user.location.latitude,
+            "longitude": user.location.longitude
+        } if user.location else None,
+        "location_required": user.location_required,
         "joined_at": user.created_at,
         "post_count": post_count
     }
 
+    _profile_cache.set(cache_key, profile_data, PROFILE_CACHE_TTL)
     return profile_data
 
 
@@ -103,27 +171,35 @@ async def update_user_profile(
     """
     # Build update dict from validated data
     db_update = update_data.to_db_update()
+    user_oid = ObjectId(user_id)
 
     if not db_update:
         # No actual updates, just fetch and return current data
-        user = await get_user_by_id(db, user_id)
+        user = await get_user_by_id_for_profile(db, user_oid)
         if not user:
             raise ValueError("User not found")
         return _build_update_response(user)
 
     # Add updated_at timestamp
-    db_update["updated_at"] = datetime.now(timezone.utc)
+    db_update["updated_at"] = get_current_timestamp()
 
-    # Update the user document
+    # Update the user document, recomputing location_required from the
+    # merged fields in the same atomic write
     result = await db.users.find_one_and_update(
-        {"_id": ObjectId(user_id)},
-        {"$set": db_update},
-        return_document=True  # Return the updated document
+        {"_id": user_oid},
+        [
+            {"$set": db_update},
+            {"$set": {"location_required": LOCATION_REQUIRED_EXPR}}
+        ],
+        projection=PROFILE_PROJECTION,
+        return_document=ReturnDocument.AFTER
     )
 
     if not result:
         raise ValueError("User not found")
 
+    invalidate_profile_cache(user_id)
+
     return _build_update_response(result)
 
 
@@ -136,12 +212,16 @@ def _build_update_response(user: dict) -> UserUpdateResponse:
         lat = location.get("latitude")
         lng = location.get("longitude")
         if lat is not None and lng is not None:
-            location_data = LocationData(latitude=lat, longitude=lng)
+            # Stored coordinates were range-checked by UserUpdate on write
+            location_data = LocationData.model_construct(latitude=lat, longitude=lng)
 
-    # Determine if location is required
-    location_required = user.get("timezone") is None or location_data is None
+    # Stored on write; derive it for users written before the flag existed
+    location_required = user.get("location_required")
+    if location_required is None:
+        location_required = user.get("timezone") is None or location_data is None
 
-    return UserUpdateResponse(
+    # Every field is already the right type, so skip re-validation
+    return UserUpdateResponse.model_construct(
         id=str(user["_id"]),
         username=user.get("username", ""),
         display_name=user.get("display_name"),
@@ -1,80 +1,91 @@
 """
 Simple caching utilities (in-memory cache).
 """
-from typing import Any, Optional, Dict
-from datetime import datetime, timedelta
-import threading
+from typing import Any, Optional, Dict, Tuple
+import time
 
 
 class SimpleCache:
     """
-    Simple thread-safe in-memory cache.
+    Simple in-memory cache with per-entry TTL.
+
+    Entries are stored as (value, expires_at) tuples keyed in a plain dict,
+    with expiry measured on the monotonic clock. Every operation is a single
+    dict get/set/pop, which is atomic under the GIL, so no lock is taken on
+    the hot read path.
     """
-    
+
     def __init__(self):
-        self._cache: Dict[str, Dict[str, Any]] = {}
-        self._lock = threading.Lock()
-    
+        self._cache: Dict[str, Tuple[Any, float]] = {}
+
     def get(self, key: str) -> Optional[Any]:
         """
         Get value from cache.
-        
+
         Args:
             key: Cache key
-            
+
         Returns:
             Cached value or None
         """
-        with self._lock:
-            if key not in self._cache:
-                return None
-            
-            entry = self._cache[key]
-            expires_at = entry.get('expires_at')
-            
-            # Check if expired
-            if expires_at and datetime.utcnow() > expires_at:
-                del self._cache[key]
-                return None
-            
-            return entry.get('value')
-    
+        entry = self._cache.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+
+        # Check if expired
+        if time.monotonic() > expires_at:
+            self._cache.pop(key, None)
+            return None
+
+        return value
+
     def set(self, key: str, value: Any, ttl_seconds: int = 300):
         """
         Set value in cache with TTL.
-        
+
         Args:
             key: Cache key
             value: Value to cache
             ttl_seconds: Time to live in seconds
         """
-        with self._lock:
-            expires_at = datetime.utcnow() + timedelta(seconds=ttl_seconds)
-            self._cache[key] = {
-                'value': value,
-                'expires_at': expires_at
-            }
-    
+        self._cache[key] = (value, time.monotonic() + ttl_seconds)
+
+    def replace(self, key: str, value: Any) -> bool:
+        """
+        Replace the value of a live entry, keeping its original expiry.
+
+        Args:
+            key: Cache key
+            value: New value
+
+        Returns:
+            True if the entry was present and replaced, False otherwise
+        """
+        entry = self._cache.get(key)
+        if entry is None or time.monotonic() > entry[1]:
+            return False
+
+        self._cache[key] = (value, entry[1])
+        return True
+
     def delete(self, key: str):
         """
         Delete key from cache.
-        
+
         Args:
             key: Cache key to delete
         """
-        with self._lock:
-            if key in self._cache:
-                del self._cache[key]
-    
+        self._cache.pop(key, None)
+
     def clear(self):
         """Clear all cache entries."""
-        with self._lock:
-            self._cache.clear()
-    
+        self._cache.clear()
+
     def size(self) -> int:
         """Get number of cache entries."""
-        with self._lock:
-            return len(self._cache)
+        return len(self._cache)
 
 
 # Global cache instance
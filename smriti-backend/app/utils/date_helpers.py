@@ -1,9 +1,12 @@
 """
 Date and time utility functions.
 """
+import time
 from datetime import datetime, timezone
 from typing import Optional
 
+_UTC = timezone.utc
+
 
 def get_current_timestamp() -> datetime:
     """
@@ -12,7 +15,7 @@ def get_current_timestamp() -> datetime:
     Returns:
         Current datetime in UTC
     """
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def format_datetime(dt: datetime, format_string: str = "%Y-%m-%d %H:%M:%S") -> str:
@@ -51,12 +54,14 @@ def is_recent(dt: datetime, minutes: int = 5) -> bool:
     Check if datetime is within recent time window.
     
     Args:
-        dt: Datetime to check
+        dt: Datetime to check (naive values are treated as UTC)
         minutes: Time window in minutes
         
     Returns:
         True if datetime is within window
     """
-    now = get_current_timestamp()
-    diff = (now - dt.replace(tzinfo=timezone.utc)).total_seconds() / 60
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=_UTC)
+    # Compare epoch seconds directly instead of building a timedelta
+    diff = (time.time() - dt.timestamp()) / 60
     return 0 <= diff <= minutes
@@ -4,6 +4,9 @@ Email validation and formatting utilities.
 import re
 from typing import Optional
 
+# RFC 5322 compliant regex (simplified), matched against the whole string
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
 
 def normalize_email(email: str) -> Optional[str]:
     """
@@ -36,12 +39,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if valid email format
     """
-    if not email:
-        return False
-    
-    # RFC 5322 compliant regex (simplified)
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(email) and _EMAIL_RE.fullmatch(email) is not None
 
 
 def extract_domain(email: str) -> Optional[str]:
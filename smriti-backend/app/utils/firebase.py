@@ -1,5 +1,3 @@
-import firebase_admin
-from firebase_admin import credentials, messaging
 from app.config.settings import settings
 import logging
 from typing import List, Dict, Optional
@@ -7,6 +5,8 @@ from typing import List, Dict, Optional
 logger = logging.getLogger(__name__)
 
 # Initialize Firebase Admin SDK
+# firebase_admin is imported inside the functions below: it takes ~200ms to
+# load, and most importers (quotes service, tests) never send a notification
 _firebase_app = None
 
 import json
@@ -19,6 +19,9 @@ def init_firebase():
     if _firebase_app:
         return _firebase_app
     
+    import firebase_admin
+    from firebase_admin import credentials
+    
     # Try to load from JSON string (Environment Variable) - Preferred for Render/Production
     cred_json = settings.FIREBASE_CREDENTIALS_JSON
     cred_path = settings.FIREBASE_CREDENTIALS_PATH
@@ -77,6 +80,8 @@ def send_push_notification(
     if not tokens:
         return {"success": 0, "failed": 0, "error": "No tokens provided"}
     
+    from firebase_admin import messaging
+    
     message = messaging.MulticastMessage(
         notification=messaging.Notification(
             title=title,
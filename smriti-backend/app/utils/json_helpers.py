@@ -1,23 +1,49 @@
 """
 JSON serialization utilities.
 """
-import json
-from datetime import datetime
-from typing import Any
+from typing import Any, Callable, Dict
+import orjson
 from bson import ObjectId
+from pydantic import BaseModel
 
 
-class JSONEncoder(json.JSONEncoder):
+def _dump_model(model: BaseModel) -> Any:
+    return model.model_dump(by_alias=True)
+
+
+# Exact-type dispatch for values orjson cannot encode itself (datetimes,
+# enums and dataclasses are native). Model classes are added on first sight.
+_DEFAULT_HANDLERS: Dict[type, Callable[[Any], Any]] = {ObjectId: str}
+
+
+def _default(obj: Any) -> Any:
     """
-    Custom JSON encoder for MongoDB ObjectId and datetime.
+    Serialize types orjson does not handle natively.
+
+    Looks up a handler by exact type; pydantic models (dumped by alias,
+    matching FastAPI's response encoding) fall back to an isinstance check
+    once per model class.
     """
+    handler = _DEFAULT_HANDLERS.get(type(obj))
+    if handler is not None:
+        return handler(obj)
+    if isinstance(obj, BaseModel):
+        _DEFAULT_HANDLERS[type(obj)] = _dump_model
+        return _dump_model(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def json_serialize_bytes(obj: Any) -> bytes:
+    """
+    Serialize object to UTF-8 encoded JSON bytes.
     
-    def default(self, obj: Any) -> Any:
-        if isinstance(obj, ObjectId):
-            return str(obj)
-        if isinstance(obj, datetime):
-            return obj.isoformat()
-        return super().default(obj)
+    Args:
+        obj: Object to serialize
+        
+    Returns:
+        JSON bytes
+    """
+    return orjson.dumps(obj, default=_default, option=orjson.OPT_NON_STR_KEYS)
 
 
 def json_serialize(obj: Any) -> str:
@@ -30,17 +56,17 @@ def json_serialize(obj: Any) -> str:
     Returns:
         JSON string
     """
-    return json.dumps(obj, cls=JSONEncoder)
+    return json_serialize_bytes(obj).decode()
 
 
-def json_deserialize(json_str: str) -> Any:
+def json_deserialize(json_str: str | bytes) -> Any:
     """
     Deserialize JSON string to object.
     
     Args:
-        json_str: JSON string
+        json_str: JSON string or bytes
         
     Returns:
         Deserialized object
     """
-    return json.loads(json_str)
+    return orjson.loads(json_str)
@@ -33,9 +33,7 @@ def log_request(method: str, path: str, status_code: int, duration: float):
         duration: Request duration in seconds
     """
     logger = get_logger("request")
-    logger.info(
-        f"{method} {path} - {status_code} - {duration:.3f}s"
-    )
+    logger.info("%s %s - %d - %.3fs", method, path, status_code, duration)
 
 
 def log_error(error: Exception, context: Optional[str] = None):
@@ -47,9 +45,5 @@ def log_error(error: Exception, context: Optional[str] = None):
         context: Additional context string
     """
     logger = get_logger("error")
-    error_msg = f"{type(error).__name__}: {str(error)}"
-    
-    if context:
-        error_msg = f"{context} - {error_msg}"
-    
-    logger.error(error_msg, exc_info=True)
+    prefix = f"{context} - " if context else ""
+    logger.error("%s%s: %s", prefix, type(error).__name__, error, exc_info=True)
@@ -3,6 +3,15 @@ Pagination utilities.
 """
 from typing import Optional, Dict, Any, List
 from math import ceil
+import orjson
+from bson import ObjectId
+from app.utils.cache import SimpleCache
+
+COUNT_CACHE_TTL = 30  # seconds
+
+# Collection totals for paginated list views, keyed by collection and filter.
+# A short staleness window is acceptable for "page X of Y" metadata.
+_count_cache = SimpleCache()
 
 
 def paginate(
@@ -28,7 +37,6 @@ def paginate(
     page = max(1, page)
     
     total_items = len(items)
-    total_pages = ceil(total_items / page_size) if total_items > 0 else 0
     
     # Calculate skip
     skip = (page - 1) * page_size
@@ -38,17 +46,187 @@ def paginate(
     
     return {
         "items": paginated_items,
+        "pagination": _pagination_meta(page, page_size, total_items)
+    }
+
+
+async def paginate_cursor(
+    collection,
+    filter: Dict[str, Any],
+    page: int = 1,
+    page_size: int = 20,
+    projection: Optional[Dict[str, Any]] = None,
+    sort: Optional[List[tuple]] = None,
+    total_items: Optional[int] = None,
+    max_page_size: int = 100
+) -> Dict[str, Any]:
+    """
+    Paginate a MongoDB query, fetching only the requested page.
+    
+    Unlike paginate, the collection is never materialized: the database
+    applies skip/limit and returns at most page_size documents.
+    
+    Args:
+        collection: Motor collection to query
+        filter: Query filter
+        page: Page number (1-indexed)
+        page_size: Number of items per page
+        projection: Optional field projection
+        sort: Optional sort specification, e.g. [("created_at", -1)]
+        total_items: Precomputed total; falls back to cached_count
+        max_page_size: Maximum allowed page size
+        
+    Returns:
+        Dictionary with paginated data and metadata (same shape as paginate)
+    """
+    page = max(1, page)
+    skip, limit = get_pagination_params(page=page, page_size=page_size, max_limit=max_page_size)
+    
+    cursor = collection.find(filter, projection)
+    if sort:
+        cursor = cursor.sort(sort)
+    cursor = cursor.skip(skip).limit(limit).batch_size(limit)
+    items = await cursor.to_list(length=limit)
+    
+    if total_items is None:
+        total_items = await cached_count(collection, filter)
+    
+    return {
+        "items": items,
+        "pagination": _pagination_meta(page, limit, total_items)
+    }
+
+
+def build_keyset_filter(
+    base_filter: Dict[str, Any],
+    after_id: Optional[ObjectId],
+    direction: int = -1
+) -> Dict[str, Any]:
+    """
+    Add an _id seek condition to a query filter.
+    
+    Args:
+        base_filter: Query filter to extend (not modified)
+        after_id: _id of the last item already returned, or None for the first page
+        direction: Sort direction on _id (-1 newest first, 1 oldest first)
+        
+    Returns:
+        Filter that starts strictly after after_id in the given direction
+    """
+    if after_id is None:
+        return base_filter
+    
+    operator = "$lt" if direction < 0 else "$gt"
+    return {**base_filter, "_id": {operator: after_id}}
+
+
+async def paginate_keyset(
+    collection,
+    filter: Dict[str, Any],
+    after_id: Optional[ObjectId] = None,
+    limit: int = 20,
+    projection: Optional[Dict[str, Any]] = None,
+    direction: int = -1,
+    max_limit: int = 100
+) -> Dict[str, Any]:
+    """
+    Paginate a MongoDB query by seeking on _id instead of skipping.
+    
+    Each page is an index seek from the previous page's last _id, so deep
+    pages cost the same as the first one.
+    
+    Args:
+        collection: Motor collection to query
+        filter: Query filter
+        after_id: next_cursor from the previous page, or None for the first page
+        limit: Number of items per page
+        projection: Optional field projection
+        direction: Sort direction on _id (-1 newest first, 1 oldest first)
+        max_limit: Maximum allowed limit
+        
+    Returns:
+        Dictionary with items and pagination metadata including next_cursor
+    """
+    _, limit = get_pagination_params(limit=limit, max_limit=max_limit)
+    
+    # Fetch one extra document to learn whether another page exists
+    cursor = collection.find(build_keyset_filter(filter, after_id, direction), projection)
+    cursor = cursor.sort("_id", direction).limit(limit + 1).batch_size(limit + 1)
+    items = await cursor.to_list(length=limit + 1)
+    
+    has_next = len(items) > limit
+    if has_next:
+        items = items[:limit]
+    
+    return {
+        "items": items,
         "pagination": {
-            "page": page,
-            "page_size": page_size,
-            "total_items": total_items,
-            "total_pages": total_pages,
-            "has_next": page < total_pages,
-            "has_prev": page > 1
+            "limit": limit,
+            "next_cursor": str(items[-1]["_id"]) if has_next else None,
+            "has_next": has_next
         }
     }
 
 
+async def cached_count(collection, filter: Dict[str, Any], ttl: int = COUNT_CACHE_TTL) -> int:
+    """
+    Count documents matching a filter, cached for a short TTL.
+    
+    An empty filter uses the collection metadata count instead of scanning.
+    
+    Args:
+        collection: Motor collection to count
+        filter: Query filter
+        ttl: Seconds to cache the count
+        
+    Returns:
+        Number of matching documents (possibly up to ttl seconds stale)
+    """
+    # Sorted keys so equivalent filters share an entry
+    filter_key = orjson.dumps(
+        filter,
+        default=_tagged_filter_value,
+        option=orjson.OPT_SORT_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    ).decode()
+    cache_key = f"{collection.name}:{filter_key}"
+    
+    count = _count_cache.get(cache_key)
+    if count is not None:
+        return count
+    
+    if filter:
+        count = await collection.count_documents(filter)
+    else:
+        count = await collection.estimated_document_count()
+    
+    _count_cache.set(cache_key, count, ttl)
+    return count
+
+
+def _tagged_filter_value(value: Any) -> Dict[str, str]:
+    """
+    Serialize a non-JSON filter value for a count cache key.
+
+    The value is tagged with its type, so ObjectId("...") and the plain
+    string "..." (or a datetime and its ISO string) never share a key.
+    """
+    return {f"${type(value).__name__}": str(value)}
+
+
+def _pagination_meta(page: int, page_size: int, total_items: int) -> Dict[str, Any]:
+    """Build the pagination metadata block shared by paginate helpers."""
+    total_pages = ceil(total_items / page_size) if total_items > 0 else 0
+    
+    return {
+        "page": page,
+        "page_size": page_size,
+        "total_items": total_items,
+        "total_pages": total_pages,
+        "has_next": page < total_pages,
+        "has_prev": page > 1
+    }
+
+
 def get_pagination_params(
     skip: Optional[int] = None,
     limit: Optional[int] = None,
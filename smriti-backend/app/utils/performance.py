@@ -1,6 +1,8 @@
 """
 Performance monitoring utilities.
 """
+import inspect
+import logging
 import time
 from functools import wraps
 from typing import Callable, Any
@@ -18,30 +20,30 @@ def measure_time(func: Callable) -> Callable:
         def my_function():
             ...
     """
-    @wraps(func)
-    async def async_wrapper(*args, **kwargs):
-        start_time = time.time()
-        try:
-            result = await func(*args, **kwargs)
-            return result
-        finally:
-            duration = time.time() - start_time
-            logger.debug(f"{func.__name__} took {duration:.3f}s")
+    # Decide once at decoration time and build only the wrapper we return
+    if inspect.iscoroutinefunction(func):
+        @wraps(func)
+        async def async_wrapper(*args, **kwargs):
+            start_ns = time.perf_counter_ns()
+            try:
+                return await func(*args, **kwargs)
+            finally:
+                if logger.isEnabledFor(logging.DEBUG):
+                    duration_ns = time.perf_counter_ns() - start_ns
+                    logger.debug("%s took %.3fs", func.__name__, duration_ns / 1e9)
+        
+        return async_wrapper
     
     @wraps(func)
     def sync_wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_ns = time.perf_counter_ns()
         try:
-            result = func(*args, **kwargs)
-            return result
+            return func(*args, **kwargs)
         finally:
-            duration = time.time() - start_time
-            logger.debug(f"{func.__name__} took {duration:.3f}s")
+            if logger.isEnabledFor(logging.DEBUG):
+                duration_ns = time.perf_counter_ns() - start_ns
+                logger.debug("%s took %.3fs", func.__name__, duration_ns / 1e9)
     
-    # Return appropriate wrapper based on function type
-    import asyncio
-    if asyncio.iscoroutinefunction(func):
-        return async_wrapper
     return sync_wrapper
 
 
@@ -56,12 +58,13 @@ class Timer:
     
     def __init__(self, name: str = "operation"):
         self.name = name
-        self.start_time = None
+        self.start_ns = None
     
     def __enter__(self):
-        self.start_time = time.time()
+        self.start_ns = time.perf_counter_ns()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        duration = time.time() - self.start_time
-        logger.debug(f"{self.name} took {duration:.3f}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            duration_ns = time.perf_counter_ns() - self.start_ns
+            logger.debug("%s took %.3fs", self.name, duration_ns / 1e9)
@@ -1,15 +1,29 @@
 """
 Response formatting utilities.
 """
-from typing import Any, Dict, Optional
-from fastapi.responses import JSONResponse
+from typing import Any, AsyncIterable, AsyncIterator, Dict, Optional
+from fastapi.responses import JSONResponse, StreamingResponse
+from app.utils.json_helpers import json_serialize_bytes
+
+
+class ORJSONResponse(JSONResponse):
+    """
+    JSON response rendered with orjson.
+
+    orjson encodes datetimes, enums and dataclasses natively; pydantic models
+    (by alias, matching FastAPI's response encoding) and ObjectIds are handled
+    by json_helpers.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return json_serialize_bytes(content)
 
 
 def success_response(
     data: Any = None,
     message: str = "Success",
     status_code: int = 200
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a standardized success response.
     
@@ -19,7 +33,7 @@ def success_response(
         status_code: HTTP status code
         
     Returns:
-        JSONResponse with standardized format
+        ORJSONResponse with standardized format
     """
     response_data = {
         "success": True,
@@ -29,14 +43,45 @@ def success_response(
     if data is not None:
         response_data["data"] = data
     
-    return JSONResponse(content=response_data, status_code=status_code)
+    return ORJSONResponse(content=response_data, status_code=status_code)
+
+
+def stream_success_response(
+    items: AsyncIterable[Any],
+    message: str = "Success",
+    status_code: int = 200
+) -> StreamingResponse:
+    """
+    Create a standardized success response whose data list is streamed.
+    
+    The body has the same shape as success_response(data=[...]), but each
+    item is encoded and sent as it arrives (e.g. straight from a Motor
+    cursor), so memory stays flat and the first bytes go out early.
+    
+    Args:
+        items: Async iterable of response items
+        message: Success message
+        status_code: HTTP status code
+        
+    Returns:
+        StreamingResponse with standardized format
+    """
+    async def body() -> AsyncIterator[bytes]:
+        yield b'{"success":true,"message":' + json_serialize_bytes(message) + b',"data":['
+        separator = b''
+        async for item in items:
+            yield separator + json_serialize_bytes(item)
+            separator = b','
+        yield b']}'
+    
+    return StreamingResponse(body(), status_code=status_code, media_type="application/json")
 
 
 def error_response(
     message: str = "An error occurred",
     status_code: int = 400,
     details: Optional[Dict[str, Any]] = None
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a standardized error response.
     
@@ -46,7 +91,7 @@ def error_response(
         details: Additional error details
         
     Returns:
-        JSONResponse with standardized error format
+        ORJSONResponse with standardized error format
     """
     response_data = {
         "success": False,
@@ -56,4 +101,4 @@ def error_response(
     if details:
         response_data["details"] = details
     
-    return JSONResponse(content=response_data, status_code=status_code)
+    return ORJSONResponse(content=response_data, status_code=status_code)
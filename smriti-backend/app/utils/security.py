@@ -1,25 +1,27 @@
 from datetime import datetime, timedelta
 from typing import Optional, Union, Any
-from jose import jwt
+import jwt
 import bcrypt
 from app.config.settings import settings
 from app.utils.date_helpers import get_current_timestamp
 
+# Signing key encoded once rather than on every token
+_SIGNING_KEY = settings.SECRET_KEY.encode('utf-8')
+_DEFAULT_EXPIRE = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+
 def create_access_token(subject: Union[str, Any], expires_delta: Optional[timedelta] = None) -> str:
     """Create JWT access token with expiration."""
-    if expires_delta:
-        expire = get_current_timestamp() + expires_delta
-    else:
-        expire = get_current_timestamp() + timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+    expire = get_current_timestamp() + (expires_delta or _DEFAULT_EXPIRE)
     
-    to_encode = {"exp": expire, "sub": str(subject)}
-    encoded_jwt = jwt.encode(to_encode, settings.SECRET_KEY, algorithm=settings.ALGORITHM)
+    sub = subject if isinstance(subject, str) else str(subject)
+    to_encode = {"exp": expire, "sub": sub}
+    encoded_jwt = jwt.encode(to_encode, _SIGNING_KEY, algorithm=settings.ALGORITHM)
     return encoded_jwt
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return bcrypt.checkpw(plain_password.encode('utf-8'), hashed_password.encode('utf-8'))
 
 def get_password_hash(password: str) -> str:
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=settings.BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password.encode('utf-8'), salt)
     return hashed.decode('utf-8')
@@ -2,7 +2,35 @@
 String manipulation utilities.
 """
 import re
-from typing import Optional
+from typing import Iterable, List, Optional
+
+_SLUG_STRIP_RE = re.compile(r'[^\w\s-]')
+_SLUG_SEPARATOR_RE = re.compile(r'[-\s]+')
+_DASH_RUN_RE = re.compile(r'-+')
+_CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+_CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+
+# ASCII slug table for str.translate, matching the regexes above: word
+# characters are kept, whitespace and hyphens become '-', the rest is deleted
+def _slug_char(c: int) -> Optional[str]:
+    ch = chr(c)
+    if ch.isalnum() or ch == '_':
+        return ch
+    if ch.isspace() or ch == '-':
+        return '-'
+    return None
+
+
+_SLUG_TABLE = {c: _slug_char(c) for c in range(128)}
+
+# Code points matched by regex \s (str.isspace), written out so the
+# deletion table for str.translate costs nothing to build at import
+_WHITESPACE_CODEPOINTS = (
+    0x09, 0x0A, 0x0B, 0x0C, 0x0D, 0x1C, 0x1D, 0x1E, 0x1F, 0x20, 0x85, 0xA0,
+    0x1680, 0x2000, 0x2001, 0x2002, 0x2003, 0x2004, 0x2005, 0x2006, 0x2007,
+    0x2008, 0x2009, 0x200A, 0x2028, 0x2029, 0x202F, 0x205F, 0x3000,
+)
+_WHITESPACE_DELETE = dict.fromkeys(_WHITESPACE_CODEPOINTS)
 
 
 def slugify(text: str) -> str:
@@ -22,8 +50,13 @@ def slugify(text: str) -> str:
     slug = text.lower()
     
     # Replace spaces and special chars with hyphens
-    slug = re.sub(r'[^\w\s-]', '', slug)
-    slug = re.sub(r'[-\s]+', '-', slug)
+    if slug.isascii():
+        # One translate pass plus one collapse instead of two regex passes
+        slug = _DASH_RUN_RE.sub('-', slug.translate(_SLUG_TABLE))
+    else:
+        # Unicode word/space rules need the regex engine
+        slug = _SLUG_STRIP_RE.sub('', slug)
+        slug = _SLUG_SEPARATOR_RE.sub('-', slug)
     
     # Remove leading/trailing hyphens
     slug = slug.strip('-')
@@ -45,8 +78,8 @@ def camel_to_snake(text: str) -> str:
         return ""
     
     # Insert underscore before uppercase letters
-    s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', text)
-    return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+    s1 = _CAMEL_WORD_RE.sub(r'\1_\2', text)
+    return _CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
 
 
 def snake_to_camel(text: str) -> str:
@@ -62,8 +95,9 @@ def snake_to_camel(text: str) -> str:
     if not text:
         return ""
     
-    components = text.split('_')
-    return components[0] + ''.join(x.capitalize() for x in components[1:])
+    components = iter(text.split('_'))
+    first = next(components)
+    return first + ''.join(map(str.capitalize, components))
 
 
 def capitalize_words(text: str) -> str:
@@ -95,7 +129,7 @@ def remove_whitespace(text: str) -> str:
     if not text:
         return ""
     
-    return re.sub(r'\s+', '', text)
+    return text.translate(_WHITESPACE_DELETE)
 
 
 def mask_email(email: str) -> str:
@@ -108,22 +142,37 @@ def mask_email(email: str) -> str:
     Returns:
         Masked email (e.g., u***@e***.com)
     """
-    if not email or '@' not in email:
+    at = email.find('@') if email else -1
+    if at < 0:
         return email
     
-    local, domain = email.split('@', 1)
+    local_len = at
+    domain = email[at + 1:]
     
     # Mask local part
-    if len(local) > 2:
-        masked_local = local[0] + '*' * (len(local) - 2) + local[-1]
+    if local_len > 2:
+        masked_local = f"{email[0]}{'*' * (local_len - 2)}{email[at - 1]}"
     else:
-        masked_local = '*' * len(local)
+        masked_local = '*' * local_len
     
-    # Mask domain
-    domain_parts = domain.split('.')
-    if len(domain_parts) >= 2:
-        masked_domain = domain_parts[0][0] + '*' * (len(domain_parts[0]) - 1) + '.' + '.'.join(domain_parts[1:])
+    # Mask domain up to its first dot, keeping the first character
+    dot = domain.find('.')
+    if dot > 0:
+        masked_domain = f"{domain[0]}{'*' * (dot - 1)}{domain[dot:]}"
     else:
         masked_domain = '*' * len(domain)
     
     return f"{masked_local}@{masked_domain}"
+
+
+def mask_emails(emails: Iterable[str]) -> List[str]:
+    """
+    Mask many email addresses at once (e.g. when scrubbing exports).
+    
+    Args:
+        emails: Email addresses
+        
+    Returns:
+        Masked emails, in the same order, using mask_email's rules
+    """
+    return [mask_email(email) for email in emails]
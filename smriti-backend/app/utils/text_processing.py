@@ -4,6 +4,10 @@ Text processing utilities.
 import re
 from typing import Optional
 
+_HASHTAG_RE = re.compile(r'#(\w+)')
+_MENTION_RE = re.compile(r'@(\w+)')
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+
 
 def truncate_text(text: str, max_length: int = 100, suffix: str = "...") -> str:
     """
@@ -31,14 +35,13 @@ def extract_hashtags(text: str) -> list[str]:
         text: Text to extract hashtags from
         
     Returns:
-        List of hashtags (without #)
+        List of unique hashtags (without #) in order of appearance
     """
     if not text:
         return []
     
-    pattern = r'#(\w+)'
-    hashtags = re.findall(pattern, text)
-    return list(set(hashtags))  # Remove duplicates
+    # Remove duplicates, keeping first-seen order
+    return list(dict.fromkeys(_HASHTAG_RE.findall(text)))
 
 
 def extract_mentions(text: str) -> list[str]:
@@ -49,14 +52,13 @@ def extract_mentions(text: str) -> list[str]:
         text: Text to extract mentions from
         
     Returns:
-        List of mentioned usernames (without @)
+        List of unique mentioned usernames (without @) in order of appearance
     """
     if not text:
         return []
     
-    pattern = r'@(\w+)'
-    mentions = re.findall(pattern, text)
-    return list(set(mentions))  # Remove duplicates
+    # Remove duplicates, keeping first-seen order
+    return list(dict.fromkeys(_MENTION_RE.findall(text)))
 
 
 def clean_html(text: str) -> str:
@@ -72,8 +74,12 @@ def clean_html(text: str) -> str:
     if not text:
         return ""
     
+    # Most user text has no markup at all; skip the regex engine for it
+    if '<' not in text:
+        return text.strip()
+    
     # Simple HTML tag removal
-    clean = re.sub(r'<[^>]+>', '', text)
+    clean = _HTML_TAG_RE.sub('', text)
     return clean.strip()
 
 
@@ -105,6 +111,12 @@ def reading_time(text: str, words_per_minute: int = 200) -> int:
     Returns:
         Estimated reading time in minutes
     """
+    # A word needs at least one character plus a separator, so short texts
+    # cannot round past one minute; skip splitting them
+    max_words = (len(text) + 1) // 2 if text else 0
+    if max_words < 1.5 * words_per_minute:
+        return 1
+    
     words = word_count(text)
     minutes = max(1, round(words / words_per_minute))
     return minutes
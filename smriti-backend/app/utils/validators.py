@@ -4,6 +4,12 @@ Validation utilities for Smriti Backend.
 import re
 from typing import Optional
 
+# Patterns are matched against the whole string
+_EMAIL_RE = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+
+# Username: 3-30 chars, alphanumeric and underscore only
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9_]{3,30}')
+
 
 def is_valid_email(email: str) -> bool:
     """
@@ -15,11 +21,7 @@ def is_valid_email(email: str) -> bool:
     Returns:
         True if email is valid, False otherwise
     """
-    if not email:
-        return False
-    
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return bool(email) and _EMAIL_RE.fullmatch(email) is not None
 
 
 def is_valid_username(username: str) -> bool:
@@ -32,12 +34,7 @@ def is_valid_username(username: str) -> bool:
     Returns:
         True if username is valid, False otherwise
     """
-    if not username:
-        return False
-    
-    # Username: 3-30 chars, alphanumeric and underscore only
-    pattern = r'^[a-zA-Z0-9_]{3,30}$'
-    return bool(re.match(pattern, username))
+    return bool(username) and _USERNAME_RE.fullmatch(username) is not None
 
 
 def is_valid_password(password: str) -> bool:
@@ -6,6 +6,8 @@ import os
 import sys
 from pathlib import Path
 
+import pytest
+
 # Set test environment variables BEFORE any app imports
 # This prevents ValidationError when settings module loads
 os.environ.setdefault("ENVIRONMENT", "test")
@@ -13,6 +15,7 @@ os.environ.setdefault("MONGODB_URI", "mongodb://localhost:27017")
 os.environ.setdefault("DATABASE_NAME", "smriti_test")
 os.environ.setdefault("SECRET_KEY", "test-secret-key-for-testing-only-not-for-production")
 os.environ.setdefault("CRON_SECRET", "test-cron-secret-for-testing-only")
+os.environ.setdefault("BCRYPT_ROUNDS", "4")  # Minimum cost keeps hashing tests fast
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
@@ -42,3 +45,31 @@ def pytest_configure(config):
         
         # Uncomment the line below to prevent tests from running on production
         # raise RuntimeError("Refusing to run tests on non-test database")
+
+
+class FakeCursor:
+    """Chainable stand-in for a Motor cursor over a fixed list of docs."""
+
+    def __init__(self, docs):
+        self._docs = docs
+
+    def sort(self, *args, **kwargs):
+        return self
+
+    def skip(self, *args, **kwargs):
+        return self
+
+    def limit(self, *args, **kwargs):
+        return self
+
+    def batch_size(self, *args, **kwargs):
+        return self
+
+    async def to_list(self, length=None):
+        return self._docs
+
+
+@pytest.fixture
+def fake_cursor():
+    """FakeCursor factory for tests that only consume to_list."""
+    return FakeCursor
@@ -37,11 +37,16 @@ def mongodb_available():
         return False
 
 
-# Skip all tests if MongoDB not available
-pytestmark = pytest.mark.skipif(
-    not mongodb_available(),
-    reason="MongoDB not available - skipping integration tests"
-)
+# Skip all tests if MongoDB not available. The fixtures clean up by name
+# prefix across the shared test database, so under pytest-xdist every test
+# here runs on one worker (make test-parallel uses --dist=loadgroup).
+pytestmark = [
+    pytest.mark.skipif(
+        not mongodb_available(),
+        reason="MongoDB not available - skipping integration tests"
+    ),
+    pytest.mark.xdist_group(name="circles_db"),
+]
 
 
 # =============================================================================
@@ -67,13 +72,13 @@ async def test_db():
     await db.posts.delete_many({"author.username": {"$regex": "^test_"}})
 
 
-@pytest_asyncio.fixture
-async def user_a(test_db):
-    """Create User A for testing."""
+async def _create_user(test_db, label: str) -> dict:
+    """Insert a throwaway test user and return its id, username and token."""
+    user_oid = ObjectId()  # Its hex also keeps username and email unique
     user_doc = {
-        "_id": ObjectId(),
-        "username": f"test_user_a_{ObjectId()}",
-        "email": f"test_a_{ObjectId()}@example.com",
+        "_id": user_oid,
+        "username": f"test_user_{label}_{user_oid}",
+        "email": f"test_{label}_{user_oid}@example.com",
         "hashed_password": "hashed",
         "created_at": datetime.utcnow().isoformat(),
         "email_verified": False,
@@ -88,51 +93,27 @@ async def user_a(test_db):
     }
 
 
+@pytest_asyncio.fixture
+async def user_a(test_db):
+    """Create User A for testing."""
+    return await _create_user(test_db, "a")
+
+
 @pytest_asyncio.fixture
 async def user_b(test_db):
     """Create User B for testing."""
-    user_doc = {
-        "_id": ObjectId(),
-        "username": f"test_user_b_{ObjectId()}",
-        "email": f"test_b_{ObjectId()}@example.com",
-        "hashed_password": "hashed",
-        "created_at": datetime.utcnow().isoformat(),
-        "email_verified": False,
-        "phone_verified": False
-    }
-    await test_db.users.insert_one(user_doc)
-    token = create_access_token(subject=str(user_doc["_id"]))
-    return {
-        "id": str(user_doc["_id"]),
-        "username": user_doc["username"],
-        "token": token
-    }
+    return await _create_user(test_db, "b")
 
 
 @pytest_asyncio.fixture
 async def user_c(test_db):
     """Create User C (non-member) for testing."""
-    user_doc = {
-        "_id": ObjectId(),
-        "username": f"test_user_c_{ObjectId()}",
-        "email": f"test_c_{ObjectId()}@example.com",
-        "hashed_password": "hashed",
-        "created_at": datetime.utcnow().isoformat(),
-        "email_verified": False,
-        "phone_verified": False
-    }
-    await test_db.users.insert_one(user_doc)
-    token = create_access_token(subject=str(user_doc["_id"]))
-    return {
-        "id": str(user_doc["_id"]),
-        "username": user_doc["username"],
-        "token": token
-    }
+    return await _create_user(test_db, "c")
 
 
-@pytest_asyncio.fixture
+@pytest_asyncio.fixture(scope="session")
 async def client():
-    """Create async HTTP client."""
+    """Create one async HTTP client shared by every test (no per-test state)."""
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as ac:
         yield ac
@@ -7,6 +7,7 @@ Tests the core permission logic for posting to circles:
 3. Design constraint: No admin removal (members cannot be kicked)
 """
 import pytest
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, MagicMock, patch
 from datetime import datetime
 from bson import ObjectId
@@ -22,6 +23,12 @@ from app.posts.service import (
 # Module path for patching check_membership (imported inside functions)
 CHECK_MEMBERSHIP_PATH = 'app.circles.dependencies.check_membership'
 
+# _id returned for every mocked posts.insert_one
+INSERTED_POST_ID = ObjectId("507f1f77bcf86cd799439077")
+
+# created_at/joined_at for sample documents; no test compares against now
+FIXED_TIME = datetime(2024, 1, 1)
+
 
 # =============================================================================
 # FIXTURES
@@ -33,9 +40,19 @@ def mock_db():
     db = MagicMock()
     db.posts = MagicMock()
     db.circles = MagicMock()
+    # Awaited collection methods; tests set return_value/side_effect on these
+    db.posts.insert_one = AsyncMock()
+    db.posts.find_one = AsyncMock()
+    db.posts.count_documents = AsyncMock()
     return db
 
 
+@pytest.fixture
+def insert_result():
+    """InsertOneResult stand-in carrying INSERTED_POST_ID."""
+    return SimpleNamespace(inserted_id=INSERTED_POST_ID)
+
+
 @pytest.fixture
 def sample_user_id():
     """Sample user ID."""
@@ -64,14 +81,14 @@ def sample_circle(sample_user_id, sample_circle_id):
             {
                 "user_id": sample_user_id,
                 "username": "testuser",
-                "joined_at": datetime.utcnow()
+                "joined_at": FIXED_TIME
             }
         ],
         "member_count": 1,
         "max_members": 5,
         "invite_code": "A7X2K9M4",
         "deletion_votes": [],
-        "created_at": datetime.utcnow(),
+        "created_at": FIXED_TIME,
         "created_by": {
             "user_id": sample_user_id,
             "username": "testuser"
@@ -89,7 +106,7 @@ def sample_post_dict(sample_user_id):
             "user_id": sample_user_id,
             "username": "testuser"
         },
-        "created_at": datetime.utcnow().isoformat()
+        "created_at": FIXED_TIME.isoformat()
     }
 
 
@@ -270,21 +287,18 @@ class TestMemberCanPost:
 
     @pytest.mark.asyncio
     async def test_member_can_post_to_single_circle(
-        self, mock_db, sample_circle_id, sample_user_id, sample_post_dict
+        self, mock_db, insert_result, sample_circle_id, sample_user_id, sample_post_dict
     ):
         """Test that member can successfully post to a circle."""
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = ObjectId()
-
         created_post = {
             **sample_post_dict,
-            "_id": mock_insert_result.inserted_id,
+            "_id": INSERTED_POST_ID,
             "visibility": "circles",
             "circle_ids": [sample_circle_id]
         }
 
-        mock_db.posts.insert_one = AsyncMock(return_value=mock_insert_result)
-        mock_db.posts.find_one = AsyncMock(return_value=created_post)
+        mock_db.posts.insert_one.return_value = insert_result
+        mock_db.posts.find_one.return_value = created_post
 
         with patch(CHECK_MEMBERSHIP_PATH, new_callable=AsyncMock) as mock_check:
             mock_check.return_value = True
@@ -303,7 +317,7 @@ class TestMemberCanPost:
 
     @pytest.mark.asyncio
     async def test_member_can_post_to_multiple_circles(
-        self, mock_db, sample_user_id, sample_post_dict
+        self, mock_db, insert_result, sample_user_id, sample_post_dict
     ):
         """Test that member can post to multiple circles at once."""
         circle_ids = [
@@ -312,18 +326,15 @@ class TestMemberCanPost:
             "507f1f77bcf86cd799439044"
         ]
 
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = ObjectId()
-
         created_post = {
             **sample_post_dict,
-            "_id": mock_insert_result.inserted_id,
+            "_id": INSERTED_POST_ID,
             "visibility": "circles",
             "circle_ids": circle_ids
         }
 
-        mock_db.posts.insert_one = AsyncMock(return_value=mock_insert_result)
-        mock_db.posts.find_one = AsyncMock(return_value=created_post)
+        mock_db.posts.insert_one.return_value = insert_result
+        mock_db.posts.find_one.return_value = created_post
 
         with patch(CHECK_MEMBERSHIP_PATH, new_callable=AsyncMock) as mock_check:
             # Member of all circles
@@ -344,7 +355,7 @@ class TestMemberCanPost:
 
     @pytest.mark.asyncio
     async def test_member_can_view_circle_posts(
-        self, mock_db, sample_circle_id, sample_user_id
+        self, mock_db, fake_cursor, sample_circle_id, sample_user_id
     ):
         """Test that member can view posts in their circle."""
         sample_posts = [
@@ -352,14 +363,8 @@ class TestMemberCanPost:
             {"_id": ObjectId(), "text_content": "Post 2"}
         ]
 
-        mock_cursor = MagicMock()
-        mock_cursor.sort = MagicMock(return_value=mock_cursor)
-        mock_cursor.skip = MagicMock(return_value=mock_cursor)
-        mock_cursor.limit = MagicMock(return_value=mock_cursor)
-        mock_cursor.to_list = AsyncMock(return_value=sample_posts)
-
-        mock_db.posts.find = MagicMock(return_value=mock_cursor)
-        mock_db.posts.count_documents = AsyncMock(return_value=2)
+        mock_db.posts.find = MagicMock(return_value=fake_cursor(sample_posts))
+        mock_db.posts.count_documents.return_value = 2
 
         with patch(CHECK_MEMBERSHIP_PATH, new_callable=AsyncMock) as mock_check:
             mock_check.return_value = True
@@ -541,7 +546,7 @@ class TestPostPermissionEdgeCases:
 
     @pytest.mark.asyncio
     async def test_post_creation_sets_correct_visibility(
-        self, mock_db, sample_circle_id, sample_user_id
+        self, mock_db, insert_result, sample_circle_id, sample_user_id
     ):
         """Test that create_circle_post sets visibility='circles'."""
         post_dict = {
@@ -549,20 +554,17 @@ class TestPostPermissionEdgeCases:
             "text_content": "Test post"
         }
 
-        mock_insert_result = MagicMock()
-        mock_insert_result.inserted_id = ObjectId()
-
         captured_post = {}
 
         async def capture_insert(doc):
             captured_post.update(doc)
-            return mock_insert_result
+            return insert_result
 
-        mock_db.posts.insert_one = AsyncMock(side_effect=capture_insert)
-        mock_db.posts.find_one = AsyncMock(return_value={
+        mock_db.posts.insert_one.side_effect = capture_insert
+        mock_db.posts.find_one.return_value = {
             **post_dict,
-            "_id": mock_insert_result.inserted_id
-        })
+            "_id": INSERTED_POST_ID
+        }
 
         with patch(CHECK_MEMBERSHIP_PATH, new_callable=AsyncMock) as mock_check:
             mock_check.return_value = True
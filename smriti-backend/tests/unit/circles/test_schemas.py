@@ -22,6 +22,9 @@ from app.circles.constants import (
     CIRCLE_COLORS,
 )
 
+# createdAt for CirclePreview samples
+FIXED_TIME = datetime(2024, 1, 1)
+
 
 class TestCircleCreate:
     """Tests for CircleCreate schema."""
@@ -201,7 +204,7 @@ class TestCirclePreview:
             maxMembers=5,
             isFull=True,
             alreadyMember=False,
-            createdAt=datetime.utcnow()
+            createdAt=FIXED_TIME
         )
         assert preview.is_full is True
         assert preview.already_member is False
@@ -215,7 +218,7 @@ class TestCirclePreview:
             maxMembers=5,
             isFull=False,
             alreadyMember=True,
-            createdAt=datetime.utcnow()
+            createdAt=FIXED_TIME
         )
         assert preview.already_member is True
 
@@ -19,6 +19,9 @@ from app.circles.service import (
 from app.circles.schemas import CircleCreate, CirclePreview
 from app.circles.constants import MAX_MEMBERS_PER_CIRCLE, MAX_CIRCLES_PER_USER
 
+# Fixed timestamp for sample documents
+FIXED_TIME = datetime(2024, 1, 1)
+
 
 # =============================================================================
 # FIXTURES
@@ -47,13 +50,13 @@ def sample_circle():
             {
                 "user_id": "507f1f77bcf86cd799439011",
                 "username": "testuser",
-                "joined_at": datetime.utcnow()
+                "joined_at": FIXED_TIME
             }
         ],
         "member_count": 1,
         "max_members": 5,
         "deletion_votes": [],
-        "created_at": datetime.utcnow(),
+        "created_at": FIXED_TIME,
         "created_by": {
             "user_id": "507f1f77bcf86cd799439011",
             "username": "testuser"
@@ -193,7 +196,7 @@ class TestFormatCircleListItem:
     def test_format_list_item_with_activity(self, sample_circle):
         """Test formatting with last activity timestamp."""
         circle = {**sample_circle}
-        activity_time = datetime.utcnow()
+        activity_time = FIXED_TIME
         circle["last_activity_at"] = activity_time
 
         result = format_circle_list_item(circle)
@@ -235,7 +238,7 @@ class TestCirclePreviewLogic:
             maxMembers=5,
             isFull=True,
             alreadyMember=False,
-            createdAt=datetime.utcnow()
+            createdAt=FIXED_TIME
         )
 
         assert preview.is_full is True
@@ -250,7 +253,7 @@ class TestCirclePreviewLogic:
             maxMembers=5,
             isFull=False,
             alreadyMember=False,
-            createdAt=datetime.utcnow()
+            createdAt=FIXED_TIME
         )
 
         assert preview.is_full is False
@@ -265,7 +268,7 @@ class TestCirclePreviewLogic:
             maxMembers=5,
             isFull=False,
             alreadyMember=True,
-            createdAt=datetime.utcnow()
+            createdAt=FIXED_TIME
         )
 
         assert preview.already_member is True
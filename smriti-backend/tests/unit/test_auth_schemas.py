@@ -2,7 +2,8 @@
 Unit tests for authentication schemas.
 """
 import pytest
-from app.auth.schemas import UserCreate, LoginRequest
+from datetime import datetime, timezone
+from app.auth.schemas import UserCreate, LoginRequest, UserResponse
 
 
 def test_user_create_schema():
@@ -25,3 +26,20 @@ def test_login_request_schema():
     }
     login = LoginRequest(**login_data)
     assert login.username == "testuser"
+
+
+@pytest.mark.parametrize("stored,expected", [
+    ({}, True),
+    ({"timezone": "Asia/Kolkata"}, True),
+    ({"timezone": "Asia/Kolkata", "location": {"latitude": 12.9, "longitude": 77.6}}, False),
+    ({"location_required": False}, False),
+])
+def test_user_response_location_required(stored, expected):
+    """Test that location_required is derived for users without the stored flag."""
+    user = UserResponse(
+        _id="507f1f77bcf86cd799439011",
+        username="testuser",
+        createdAt=datetime(2026, 1, 25, tzinfo=timezone.utc),
+        **stored
+    )
+    assert user.location_required is expected
@@ -5,7 +5,7 @@ Tests sentence splitting, text extraction, and quote generation.
 """
 
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 import sys
 
 # Mock database connection before importing extraction module
@@ -193,41 +193,38 @@ class TestExtractQuoteFromText:
         assert result.count(".") >= 2
 
 
+@pytest.fixture
+def db_aggregating(fake_cursor):
+    """Factory for a mock database whose posts.aggregate cursor returns docs."""
+    def _db_aggregating(docs):
+        db = MagicMock()
+        db.posts.aggregate.return_value = fake_cursor(docs)
+        return db
+    return _db_aggregating
+
+
 class TestPickRandomQuote:
     """Test database quote picking with mocked database."""
 
-    @pytest.fixture
-    def mock_db(self):
-        """Create a mock database."""
-        mock = MagicMock()
-        mock.posts = MagicMock()
-        return mock
-
     @pytest.mark.asyncio
-    async def test_returns_none_when_no_posts(self):
+    async def test_returns_none_when_no_posts(self, db_aggregating):
         """Should return None when no posts exist."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
+            mock_get_db.return_value = db_aggregating([])
 
             result = await pick_random_quote()
 
             assert result is None
 
     @pytest.mark.asyncio
-    async def test_returns_quote_from_single_post(self):
+    async def test_returns_quote_from_single_post(self, db_aggregating):
         """Should extract quote from a single post."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[
+            mock_get_db.return_value = db_aggregating([
                 {
                     "_id": "post123",
                     "title": "A great thought",
@@ -238,8 +235,6 @@ class TestPickRandomQuote:
                     }
                 }
             ])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
 
             result = await pick_random_quote()
 
@@ -250,14 +245,12 @@ class TestPickRandomQuote:
             assert result["author_username"] == "thinker"
 
     @pytest.mark.asyncio
-    async def test_returns_quote_from_multiple_posts(self):
+    async def test_returns_quote_from_multiple_posts(self, db_aggregating):
         """Should return quote from one of multiple posts."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[
+            mock_get_db.return_value = db_aggregating([
                 {
                     "_id": "post1",
                     "title": "First post",
@@ -277,8 +270,6 @@ class TestPickRandomQuote:
                     "author": {"user_id": "u3", "username": "user3"}
                 }
             ])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
 
             result = await pick_random_quote()
 
@@ -286,14 +277,12 @@ class TestPickRandomQuote:
             assert result["post_id"] in ["post1", "post2", "post3"]
 
     @pytest.mark.asyncio
-    async def test_skips_posts_with_unusable_text(self):
+    async def test_skips_posts_with_unusable_text(self, db_aggregating):
         """Should skip posts with text that's too short."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[
+            mock_get_db.return_value = db_aggregating([
                 {
                     "_id": "bad_post",
                     "title": "Hi",  # Too short
@@ -307,8 +296,6 @@ class TestPickRandomQuote:
                     "author": {"user_id": "u2", "username": "user2"}
                 }
             ])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
 
             result = await pick_random_quote()
 
@@ -316,14 +303,12 @@ class TestPickRandomQuote:
             assert result["post_id"] == "good_post"
 
     @pytest.mark.asyncio
-    async def test_handles_post_with_only_title(self):
+    async def test_handles_post_with_only_title(self, db_aggregating):
         """Should extract quote from post with only title."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[
+            mock_get_db.return_value = db_aggregating([
                 {
                     "_id": "title_only",
                     "title": "The best time to plant a tree was 20 years ago.",
@@ -331,8 +316,6 @@ class TestPickRandomQuote:
                     "author": {"user_id": "u1", "username": "wisdom"}
                 }
             ])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
 
             result = await pick_random_quote()
 
@@ -340,14 +323,12 @@ class TestPickRandomQuote:
             assert "plant a tree" in result["quote_text"]
 
     @pytest.mark.asyncio
-    async def test_handles_post_with_only_content(self):
+    async def test_handles_post_with_only_content(self, db_aggregating):
         """Should extract quote from post with only text_content."""
         with patch('app.quotes.extraction.get_database') as mock_get_db:
             from app.quotes.extraction import pick_random_quote
 
-            mock_db = MagicMock()
-            mock_cursor = AsyncMock()
-            mock_cursor.to_list = AsyncMock(return_value=[
+            mock_get_db.return_value = db_aggregating([
                 {
                     "_id": "content_only",
                     "title": "",
@@ -355,8 +336,6 @@ class TestPickRandomQuote:
                     "author": {"user_id": "u1", "username": "oscar"}
                 }
             ])
-            mock_db.posts.aggregate = MagicMock(return_value=mock_cursor)
-            mock_get_db.return_value = mock_db
 
             result = await pick_random_quote()
 
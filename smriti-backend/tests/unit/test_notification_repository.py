@@ -0,0 +1,63 @@
+"""
+Unit tests for the notifications repository.
+
+Uses a mocked collection to test token grouping logic.
+"""
+import pytest
+from unittest.mock import MagicMock
+
+from app.notifications.repository import NotificationRepository
+
+
+@pytest.fixture
+def make_repo(fake_cursor):
+    """Factory for a repository whose device_tokens cursor returns token_docs."""
+    def _make_repo(token_docs):
+        mock_db = MagicMock()
+        mock_db.device_tokens.find = MagicMock(return_value=fake_cursor(token_docs))
+        return NotificationRepository(mock_db), mock_db.device_tokens
+    return _make_repo
+
+
+class TestGetTokensGroupedByUser:
+    """Test batched token lookup for multiple users."""
+
+    @pytest.mark.asyncio
+    async def test_groups_tokens_by_user(self, make_repo):
+        """Should return tokens keyed by user_id from a single query."""
+        repo, collection = make_repo([
+            {"user_id": "u1", "token": "t1"},
+            {"user_id": "u2", "token": "t2"},
+            {"user_id": "u1", "token": "t3"},
+        ])
+
+        result = await repo.get_tokens_grouped_by_user(["u1", "u2", "u1"])
+
+        assert result == {"u1": ["t1", "t3"], "u2": ["t2"]}
+        collection.find.assert_called_once()
+        query = collection.find.call_args[0][0]
+        assert sorted(query["user_id"]["$in"]) == ["u1", "u2"]
+
+    @pytest.mark.asyncio
+    async def test_skips_empty_tokens_and_caps_per_user(self, make_repo):
+        """Should drop empty tokens and keep at most max_per_user per user."""
+        repo, _ = make_repo([
+            {"user_id": "u1", "token": ""},
+            {"user_id": "u1", "token": "t1"},
+            {"user_id": "u1", "token": "t2"},
+            {"user_id": "u1", "token": "t3"},
+        ])
+
+        result = await repo.get_tokens_grouped_by_user(["u1"], max_per_user=2)
+
+        assert result == {"u1": ["t1", "t2"]}
+
+    @pytest.mark.asyncio
+    async def test_empty_user_ids_skips_query(self, make_repo):
+        """Should not hit the database when no user ids are given."""
+        repo, collection = make_repo([])
+
+        result = await repo.get_tokens_grouped_by_user([])
+
+        assert result == {}
+        collection.find.assert_not_called()
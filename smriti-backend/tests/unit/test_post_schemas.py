@@ -2,7 +2,9 @@
 Unit tests for post schemas.
 """
 import pytest
-from app.posts.schemas import PostCreate, ContentType
+from datetime import datetime
+from bson import ObjectId
+from app.posts.schemas import PostCreate, PostResponse, ContentType, build_post_response
 
 
 def test_post_create_schema():
@@ -22,3 +24,25 @@ def test_content_type_enum():
     assert ContentType.note == "note"
     assert ContentType.link == "link"
     assert ContentType.document == "document"
+
+
+def test_build_post_response_matches_validated_model():
+    """build_post_response should serialize the same as a validated PostResponse."""
+    post = {
+        "_id": ObjectId(),
+        "content_type": "note",
+        "title": "Test Post",
+        "text_content": "This is a test",
+        "author": {"user_id": "507f1f77bcf86cd799439011", "username": "testuser"},
+        "visibility": "public",
+        "created_at": datetime(2026, 1, 1)
+    }
+
+    validated = PostResponse(**{**post, "_id": str(post["_id"])})
+    built = build_post_response(post)
+
+    assert built.model_dump(by_alias=True) == validated.model_dump(by_alias=True)
+    assert built.post_id == validated.post_id
+
+    # Converting the same (now mutated) document again gives the same result
+    assert build_post_response(post).model_dump(by_alias=True) == built.model_dump(by_alias=True)
@@ -0,0 +1,152 @@
+"""
+Unit tests for the posts service layer.
+
+Uses a mocked database to test the per-user post counter cache and the
+user posts query.
+"""
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+
+from app.posts import service
+from app.users import cache as profile_cache
+
+
+USER_ID = "507f1f77bcf86cd799439011"
+POST_ID = "507f1f77bcf86cd799439022"
+
+
+@pytest.fixture(autouse=True)
+def clear_count_cache():
+    """Start and finish every test with an empty counter cache."""
+    service._post_count_cache.clear()
+    yield
+    service._post_count_cache.clear()
+
+
+@pytest.fixture
+def mock_db():
+    """Database with a posts collection holding five posts for USER_ID."""
+    db = MagicMock()
+    db.posts.count_documents = AsyncMock(return_value=5)
+    db.posts.find_one_and_delete = AsyncMock(return_value={
+        "_id": ObjectId(),
+        "author": {"user_id": USER_ID}
+    })
+    return db
+
+
+class TestCountPostsByUser:
+    """Test cached post counting."""
+
+    @pytest.mark.asyncio
+    async def test_count_is_cached(self, mock_db):
+        """Should only run count_documents once while the counter is cached."""
+        assert await service.count_posts_by_user(mock_db, USER_ID) == 5
+        assert await service.count_posts_by_user(mock_db, USER_ID) == 5
+
+        mock_db.posts.count_documents.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_delete_decrements_cached_count(self, mock_db):
+        """Should adjust the cached counter instead of recounting after a delete."""
+        await service.count_posts_by_user(mock_db, USER_ID)
+        await service.delete_post_db(mock_db, POST_ID)
+
+        assert await service.count_posts_by_user(mock_db, USER_ID) == 4
+        mock_db.posts.count_documents.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_adjust_keeps_original_expiry(self, mock_db):
+        """Should not push the counter's TTL forward when adjusting it."""
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+            await service.count_posts_by_user(mock_db, USER_ID)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0 + service.POST_COUNT_CACHE_TTL - 1):
+            await service.delete_post_db(mock_db, POST_ID)
+        with patch("app.utils.cache.time.monotonic", return_value=1000.0 + service.POST_COUNT_CACHE_TTL + 1):
+            assert await service.count_posts_by_user(mock_db, USER_ID) == 5
+
+        assert mock_db.posts.count_documents.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_delete_of_missing_post_leaves_count(self, mock_db):
+        """Should not touch the counter when nothing was deleted."""
+        mock_db.posts.find_one_and_delete.return_value = None
+
+        await service.count_posts_by_user(mock_db, USER_ID)
+        await service.delete_post_db(mock_db, POST_ID)
+
+        assert await service.count_posts_by_user(mock_db, USER_ID) == 5
+
+
+def _find_returning(docs):
+    """Build a find() mock whose chainable cursor yields docs."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.batch_size.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+    return MagicMock(return_value=cursor), cursor
+
+
+@pytest.fixture
+def cached_profiles():
+    """Seed USER_ID's public and own profiles in the profile cache."""
+    profile_cache._profile_cache.clear()
+    for prefix in (profile_cache.PROFILE_CACHE_PREFIX, profile_cache.OWN_PROFILE_CACHE_PREFIX):
+        profile_cache._profile_cache.set(f"{prefix}{USER_ID}", {"post_count": 5})
+    yield profile_cache._profile_cache
+    profile_cache._profile_cache.clear()
+
+
+class TestProfileInvalidation:
+    """Test that every post write drops the author's cached profiles."""
+
+    @pytest.mark.asyncio
+    async def test_circle_post_invalidates_profiles(self, mock_db, cached_profiles):
+        """Should drop cached profiles when a post is created in a circle."""
+        mock_db.posts.insert_one = AsyncMock(return_value=MagicMock(inserted_id=ObjectId(POST_ID)))
+        mock_db.posts.find_one = AsyncMock(return_value={"_id": ObjectId(POST_ID)})
+        post_dict = {"author": {"user_id": USER_ID, "username": "testuser"}}
+
+        with patch.object(service, "validate_circle_membership_for_post", AsyncMock(return_value=(True, None))):
+            await service.create_circle_post(mock_db, post_dict, ["circle1"], USER_ID)
+
+        assert cached_profiles.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_delete_invalidates_profiles(self, mock_db, cached_profiles):
+        """Should drop cached profiles when a post is deleted."""
+        await service.delete_post_db(mock_db, POST_ID)
+
+        assert cached_profiles.size() == 0
+
+
+class TestGetPostsByUser:
+    """Test the user posts page query."""
+
+    @pytest.mark.asyncio
+    async def test_fetches_page_in_one_batch(self, mock_db):
+        """Should size the batch to the page and skip only when asked."""
+        mock_db.posts.find, cursor = _find_returning([])
+
+        await service.get_posts_by_user(mock_db, USER_ID, 0, 20)
+
+        mock_db.posts.find.assert_called_once_with({"author.user_id": USER_ID})
+        cursor.batch_size.assert_called_once_with(20)
+        cursor.skip.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_before_uses_keyset_filter(self, mock_db):
+        """Should seek with created_at < before instead of skipping."""
+        mock_db.posts.find, cursor = _find_returning([])
+        before = datetime(2026, 1, 25, tzinfo=timezone.utc)
+
+        await service.get_posts_by_user(mock_db, USER_ID, 0, 20, before)
+
+        mock_db.posts.find.assert_called_once_with({
+            "author.user_id": USER_ID,
+            "created_at": {"$lt": before}
+        })
@@ -0,0 +1,64 @@
+"""
+Unit tests for the Today's Quote repository.
+
+Uses a mocked collection to check the queries sent to MongoDB.
+"""
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.quotes import repository
+from app.quotes.constants import COLLECTION_NAME, HISTORY_INDEX_FILTER
+
+
+USER_ID = "507f1f77bcf86cd799439011"
+
+
+def _collection_returning(docs, count):
+    """Build a collection mock whose find() cursor yields docs; returns (collection, cursor)."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.hint.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+
+    collection = MagicMock()
+    collection.find.return_value = cursor
+    collection.count_documents = AsyncMock(return_value=count)
+    return collection, cursor
+
+
+class TestGetQuoteHistory:
+    """Test the history query against the partial history index."""
+
+    @pytest.mark.asyncio
+    async def test_query_is_covered_by_partial_index_filter(self):
+        """Should repeat every partialFilterExpression predicate so the planner can use the index."""
+        collection, _ = _collection_returning([{"day_key": "2026-01-25"}], count=1)
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        with patch.object(repository, "get_database", MagicMock(return_value=db)):
+            documents, total = await repository.get_quote_history(USER_ID, skip=0, limit=10)
+
+        db.__getitem__.assert_called_with(COLLECTION_NAME)
+        query = collection.find.call_args[0][0]
+        assert query["user_id"] == USER_ID
+        for field, predicate in HISTORY_INDEX_FILTER.items():
+            assert query[field] == predicate
+        collection.count_documents.assert_awaited_once_with(query)
+        assert documents == [{"day_key": "2026-01-25"}]
+        assert total == 1
+
+    @pytest.mark.asyncio
+    async def test_query_does_not_hint_the_index(self):
+        """Should not hint the partial index, which may not exist on older deployments."""
+        collection, cursor = _collection_returning([], count=0)
+        db = MagicMock()
+        db.__getitem__.return_value = collection
+
+        with patch.object(repository, "get_database", MagicMock(return_value=db)):
+            await repository.get_quote_history(USER_ID)
+
+        cursor.hint.assert_not_called()
+        assert "hint" not in collection.count_documents.call_args.kwargs
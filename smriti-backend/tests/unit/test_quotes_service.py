@@ -0,0 +1,202 @@
+"""
+Unit tests for the Today's Quote service layer.
+
+Uses a mocked repository to test business logic.
+"""
+import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from pymongo.errors import BulkWriteError
+
+from app.quotes import service
+from app.quotes.schemas import QuoteStatus
+
+
+DAY_KEY = "2026-01-25"
+
+
+@pytest.fixture
+def fixed_day():
+    """Pin the sunrise-based day so tests do not depend on the clock."""
+    sunrise_info = {
+        "day_key": DAY_KEY,
+        "next_sunrise_utc": datetime.now(timezone.utc) + timedelta(hours=6)
+    }
+    service._today_quote_cache.clear()
+    with patch.object(service, "get_sunrise_info_for_user", return_value=sunrise_info):
+        yield sunrise_info
+    service._today_quote_cache.clear()
+
+
+def _delivered_record():
+    sent_at = datetime(2026, 1, 25, 14, 32, tzinfo=timezone.utc)
+    return {
+        "push_sent": True,
+        "quote_text": "Be yourself; everyone else is already taken.",
+        "source_author_user_id": "author1",
+        "source_author_username": "oscar",
+        "source_post_id": "post1",
+        "push_sent_at_utc": sent_at,
+        "created_at_utc": sent_at
+    }
+
+
+class TestGetTodayQuote:
+    """Test the branches of get_today_quote."""
+
+    @pytest.mark.asyncio
+    async def test_no_record_returns_shared_pending_response(self, fixed_day):
+        """Should return the prebuilt 'arrive soon' response when no record exists."""
+        with patch.object(service.repository, "get_quote_for_user_day", AsyncMock(return_value=None)):
+            first = await service.get_today_quote("user1")
+            second = await service.get_today_quote("user2")
+
+        assert first is second
+        assert first.has_quote is False
+        assert first.status == QuoteStatus.PENDING
+        assert first.message == "Your quote will arrive soon"
+
+    @pytest.mark.asyncio
+    async def test_unsent_record_returns_pending_later(self, fixed_day):
+        """Should return the 'later today' response when push is not sent yet."""
+        record = {"push_sent": False}
+        with patch.object(service.repository, "get_quote_for_user_day", AsyncMock(return_value=record)):
+            result = await service.get_today_quote("user1")
+
+        assert result.status == QuoteStatus.PENDING
+        assert result.message == "Your quote will arrive later today"
+
+    @pytest.mark.asyncio
+    async def test_sent_without_quote_returns_unavailable(self, fixed_day):
+        """Should return the unavailable response when no quote was stored."""
+        record = {"push_sent": True, "quote_text": None}
+        with patch.object(service.repository, "get_quote_for_user_day", AsyncMock(return_value=record)):
+            result = await service.get_today_quote("user1")
+
+        assert result.has_quote is False
+        assert result.status == QuoteStatus.UNAVAILABLE
+
+    @pytest.mark.asyncio
+    async def test_delivered_quote(self, fixed_day):
+        """Should build a delivered response from the stored record."""
+        record = _delivered_record()
+        with patch.object(service.repository, "get_quote_for_user_day", AsyncMock(return_value=record)):
+            result = await service.get_today_quote("user1")
+
+        assert result.has_quote is True
+        assert result.status == QuoteStatus.DELIVERED
+        assert result.quote.text == record["quote_text"]
+        assert result.quote.author.username == "oscar"
+        assert result.quote.day_key == DAY_KEY
+
+    @pytest.mark.asyncio
+    async def test_delivered_quote_is_cached_for_the_day(self, fixed_day):
+        """Should serve repeat requests for a delivered quote without a DB read."""
+        lookup = AsyncMock(return_value=_delivered_record())
+        with patch.object(service.repository, "get_quote_for_user_day", lookup):
+            first = await service.get_today_quote("user1")
+            second = await service.get_today_quote("user1")
+
+        assert second is first
+        lookup.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_cached_quote_ignored_on_new_day(self, fixed_day):
+        """Should not serve yesterday's cached quote once the day_key changes."""
+        lookup = AsyncMock(return_value=_delivered_record())
+        with patch.object(service.repository, "get_quote_for_user_day", lookup):
+            await service.get_today_quote("user1")
+            fixed_day["day_key"] = "2026-01-26"
+            result = await service.get_today_quote("user1")
+
+        assert result.quote.day_key == "2026-01-26"
+        assert lookup.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_pending_response_is_not_cached(self, fixed_day):
+        """Should re-check the database while the quote is still pending."""
+        lookup = AsyncMock(return_value={"push_sent": False})
+        with patch.object(service.repository, "get_quote_for_user_day", lookup):
+            await service.get_today_quote("user1")
+            await service.get_today_quote("user1")
+
+        assert lookup.await_count == 2
+
+
+PENDING_RECORDS = [
+    {"_id": "507f1f77bcf86cd799439011", "user_id": "user1", "day_key": DAY_KEY},
+    {"_id": "507f1f77bcf86cd799439022", "user_id": "user2", "day_key": DAY_KEY},
+]
+
+QUOTE = {
+    "quote_text": "Be yourself; everyone else is already taken.",
+    "post_id": "post1",
+    "author_user_id": "author1",
+    "author_username": "oscar"
+}
+
+
+@pytest.fixture
+def push_run():
+    """Patch the push sender's collaborators; yields (mark_sent, send_push, events)."""
+    events = []
+    mark_sent = AsyncMock(side_effect=lambda records: events.append("write"))
+    send_push = MagicMock(side_effect=lambda **kwargs: events.append("push") or True)
+    notification_repo = MagicMock()
+    notification_repo.get_tokens_grouped_by_user = AsyncMock(
+        return_value={"user1": ["t1"], "user2": ["t2"]}
+    )
+
+    with patch.object(service, "get_database", MagicMock()), \
+            patch.object(service, "NotificationRepository", return_value=notification_repo), \
+            patch.object(service, "pick_random_quote", AsyncMock(return_value=QUOTE)), \
+            patch.object(service, "_send_quote_push", send_push), \
+            patch.object(service.repository, "get_pending_pushes", AsyncMock(return_value=PENDING_RECORDS)), \
+            patch.object(service.repository, "mark_quotes_sent_bulk", mark_sent):
+        yield mark_sent, send_push, events
+
+
+class TestSendPendingPushes:
+    """Test that records are persisted before their pushes go out."""
+
+    @pytest.mark.asyncio
+    async def test_writes_batch_before_pushing(self, push_run):
+        """Should bulk-write the sent records, then push each written record."""
+        mark_sent, send_push, events = push_run
+
+        result = await service.send_pending_pushes()
+
+        assert events == ["write", "push", "push"]
+        assert [r["record_id"] for r in mark_sent.await_args.args[0]] == [
+            "507f1f77bcf86cd799439011", "507f1f77bcf86cd799439022"
+        ]
+        assert result.processed_count == 2
+        assert result.sent_count == 2
+        assert result.error_count == 0
+
+    @pytest.mark.asyncio
+    async def test_failed_write_sends_no_pushes(self, push_run):
+        """Should not push anything for a batch that could not be written."""
+        mark_sent, send_push, _ = push_run
+        mark_sent.side_effect = RuntimeError("db down")
+
+        result = await service.send_pending_pushes()
+
+        send_push.assert_not_called()
+        assert result.processed_count == 2
+        assert result.sent_count == 0
+        assert result.error_count == 2
+
+    @pytest.mark.asyncio
+    async def test_partial_write_pushes_only_written_records(self, push_run):
+        """Should skip the push for records the unordered bulk write rejected."""
+        mark_sent, send_push, _ = push_run
+        mark_sent.side_effect = BulkWriteError({"writeErrors": [{"index": 0, "errmsg": "boom"}]})
+
+        result = await service.send_pending_pushes()
+
+        send_push.assert_called_once()
+        assert send_push.call_args.kwargs["tokens"] == ["t2"]
+        assert result.sent_count == 1
+        assert result.error_count == 1
@@ -1,8 +1,12 @@
 """
 Unit tests for security utilities.
 """
+import jwt
 import pytest
-from app.utils.security import verify_password, get_password_hash
+from datetime import timedelta
+from pydantic import ValidationError
+from app.config.settings import Settings, settings
+from app.utils.security import create_access_token, verify_password, get_password_hash
 
 
 def test_password_hashing():
@@ -26,3 +30,50 @@ def test_password_hash_uniqueness():
     # But both should verify correctly
     assert verify_password(password, hash1) is True
     assert verify_password(password, hash2) is True
+
+
+def test_password_hash_uses_configured_rounds():
+    """Test that new hashes use the configured bcrypt cost factor."""
+    hashed = get_password_hash("test_password_123")
+
+    assert hashed.split("$")[2] == f"{settings.BCRYPT_ROUNDS:02d}"
+
+
+@pytest.mark.parametrize("environment,rounds", [
+    ("production", 9),
+    ("development", 4),
+    ("test", 3),
+    ("test", 32),
+])
+def test_bcrypt_rounds_out_of_range_is_rejected(environment, rounds):
+    """Test that BCRYPT_ROUNDS outside the allowed range fails settings validation."""
+    with pytest.raises(ValidationError):
+        Settings(_env_file=None, ENVIRONMENT=environment, BCRYPT_ROUNDS=rounds)
+
+
+@pytest.mark.parametrize("environment,rounds", [
+    ("production", 10),
+    ("production", 31),
+    ("test", 4),
+])
+def test_bcrypt_rounds_in_range_is_accepted(environment, rounds):
+    """Test that BCRYPT_ROUNDS within the allowed range is kept as configured."""
+    configured = Settings(_env_file=None, ENVIRONMENT=environment, BCRYPT_ROUNDS=rounds)
+
+    assert configured.BCRYPT_ROUNDS == rounds
+
+
+def test_access_token_round_trip():
+    """Test that issued tokens decode with the app secret and carry the subject."""
+    token = create_access_token("507f1f77bcf86cd799439011")
+    payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
+
+    assert payload["sub"] == "507f1f77bcf86cd799439011"
+
+
+def test_expired_access_token_is_rejected():
+    """Test that an expired token fails verification."""
+    token = create_access_token("user", expires_delta=timedelta(seconds=-1))
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM])
@@ -0,0 +1,183 @@
+"""
+Unit tests for the users service layer.
+
+Uses a mocked database to test profile caching.
+"""
+import pytest
+from datetime import datetime
+from unittest.mock import AsyncMock, MagicMock
+from bson import ObjectId
+from fastapi import HTTPException
+from pymongo import ReturnDocument
+
+from app.users import service
+from app.users.dependencies import valid_user_id
+from app.users.schemas import UserUpdate
+
+
+USER_ID = "507f1f77bcf86cd799439011"
+USER_OID = ObjectId(USER_ID)
+
+
+@pytest.fixture(autouse=True)
+def clear_profile_cache():
+    """Start and finish every test with an empty profile cache."""
+    service._profile_cache.clear()
+    yield
+    service._profile_cache.clear()
+
+
+@pytest.fixture
+def mock_db(fake_cursor):
+    """Database whose users collection returns a single user document."""
+    db = MagicMock()
+    db.users.aggregate.return_value = fake_cursor([{
+        "_id": ObjectId(USER_ID),
+        "username": "testuser",
+        "display_name": "Test User",
+        "created_at": datetime(2026, 1, 1),
+        "post_count": 3
+    }])
+    db.users.find_one_and_update = AsyncMock(return_value={
+        "_id": ObjectId(USER_ID),
+        "username": "testuser",
+        "timezone": "Asia/Kolkata"
+    })
+    return db
+
+
+class TestProfileCache:
+    """Test cache-aside behaviour of profile lookups."""
+
+    @pytest.mark.asyncio
+    async def test_public_profile_is_cached(self, mock_db):
+        """Should hit the database only once for repeated profile reads."""
+        first = await service.get_user_profile_by_id(mock_db, USER_OID)
+        second = await service.get_user_profile_by_id(mock_db, USER_OID)
+
+        assert first == second
+        assert first["post_count"] == 3
+        assert first["joined_at"] == datetime(2026, 1, 1)
+        mock_db.users.aggregate.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_user_is_not_cached(self, mock_db, fake_cursor):
+        """Should not cache a not-found result."""
+        mock_db.users.aggregate.return_value = fake_cursor([])
+
+        assert await service.get_user_profile_by_id(mock_db, USER_OID) is None
+        assert service._profile_cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_cache_key_matches_invalidation(self, mock_db):
+        """Should cache under the same string key that invalidation drops."""
+        await service.get_user_profile_by_id(mock_db, USER_OID)
+        service.invalidate_profile_cache(USER_ID)
+
+        assert service._profile_cache.size() == 0
+
+    @pytest.mark.asyncio
+    async def test_update_invalidates_cached_profile(self, mock_db):
+        """Should drop the cached profile after a successful update."""
+        await service.get_user_profile_by_id(mock_db, USER_OID)
+        await service.update_user_profile(
+            mock_db, USER_ID, UserUpdate(timezone="Asia/Kolkata")
+        )
+        await service.get_user_profile_by_id(mock_db, USER_OID)
+
+        assert mock_db.users.aggregate.call_count == 2
+
+
+class TestValidUserId:
+    """Test the user_id path dependency."""
+
+    def test_parses_valid_id(self):
+        """Should return the parsed ObjectId."""
+        assert valid_user_id(USER_ID) == USER_OID
+
+    def test_rejects_malformed_id(self):
+        """Should raise 400 for a malformed id."""
+        with pytest.raises(HTTPException) as exc_info:
+            valid_user_id("not-an-id")
+
+        assert exc_info.value.status_code == 400
+
+
+class TestBuildUpdateResponse:
+    """Test building the update response from a stored user document."""
+
+    def test_matches_validated_model(self):
+        """Should serialize the same as a fully validated UserUpdateResponse."""
+        user = {
+            "_id": USER_OID,
+            "username": "testuser",
+            "timezone": "Asia/Kolkata",
+            "location": {"latitude": 12.97, "longitude": 77.59}
+        }
+
+        built = service._build_update_response(user)
+        validated = service.UserUpdateResponse(
+            id=USER_ID,
+            username="testuser",
+            timezone="Asia/Kolkata",
+            location={"latitude": 12.97, "longitude": 77.59},
+            location_required=False
+        )
+
+        assert built.model_dump() == validated.model_dump()
+
+
+class TestUserUpdateToDbUpdate:
+    """Test building the $set document from a profile update."""
+
+    def test_only_sent_fields_are_included(self):
+        """Should include only the fields the client sent."""
+        assert UserUpdate(timezone="Asia/Kolkata").to_db_update() == {
+            "timezone": "Asia/Kolkata"
+        }
+        assert UserUpdate(latitude=12.5, longitude=77.5).to_db_update() == {
+            "location": {"latitude": 12.5, "longitude": 77.5}
+        }
+
+    def test_empty_and_null_updates_are_empty(self):
+        """Should return an empty dict for omitted or explicitly null fields."""
+        assert UserUpdate().to_db_update() == {}
+        assert UserUpdate(timezone=None, latitude=None, longitude=None).to_db_update() == {}
+
+
+class TestUpdateUserProfile:
+    """Test the profile update write path."""
+
+    @pytest.mark.asyncio
+    async def test_update_returns_projected_document(self, mock_db):
+        """Should ask for the updated document, projected to profile fields."""
+        await service.update_user_profile(
+            mock_db, USER_ID, UserUpdate(timezone="Asia/Kolkata")
+        )
+
+        kwargs = mock_db.users.find_one_and_update.call_args.kwargs
+        assert kwargs["projection"] == service.PROFILE_PROJECTION
+        assert kwargs["return_document"] == ReturnDocument.AFTER
+
+    @pytest.mark.asyncio
+    async def test_update_recomputes_location_required(self, mock_db):
+        """Should recompute the stored location_required flag in the same write."""
+        await service.update_user_profile(
+            mock_db, USER_ID, UserUpdate(timezone="Asia/Kolkata")
+        )
+
+        pipeline = mock_db.users.find_one_and_update.call_args.args[1]
+        assert pipeline[0]["$set"]["timezone"] == "Asia/Kolkata"
+        assert pipeline[1] == {"$set": {"location_required": service.LOCATION_REQUIRED_EXPR}}
+
+    def test_stored_location_required_is_used(self):
+        """Should return the stored flag and fall back only for legacy documents."""
+        stored = service._build_update_response({
+            "_id": USER_OID, "username": "testuser", "location_required": False
+        })
+        legacy = service._build_update_response({
+            "_id": USER_OID, "username": "testuser"
+        })
+
+        assert stored.location_required is False
+        assert legacy.location_required is True
@@ -1,7 +1,22 @@
 """
 Unit tests for utility functions.
 """
+import inspect
+import json
+import logging
+import re
 import pytest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+from bson import ObjectId
+
+from app.auth.schemas import LocationData
+from app.utils.cache import SimpleCache
+from app.utils import (
+    date_helpers, email_helpers, json_helpers, logger, pagination, performance,
+    string_helpers, text_processing, validators
+)
+from app.utils.response_formatter import ORJSONResponse, stream_success_response, success_response
 
 
 def test_example_utility():
@@ -14,3 +29,319 @@ def test_string_validation():
     """Test string validation utilities."""
     # Placeholder for actual utility tests
     assert isinstance("test", str)
+
+
+def test_orjson_response_encodes_mongo_and_pydantic_types():
+    """ORJSONResponse should encode datetimes, ObjectIds and pydantic models."""
+    object_id = ObjectId()
+    response = ORJSONResponse(content={
+        "id": object_id,
+        "joined_at": datetime(2026, 1, 25, 14, 32),
+        "location": LocationData(latitude=12.5, longitude=77.5)
+    })
+
+    assert json.loads(response.body) == {
+        "id": str(object_id),
+        "joined_at": "2026-01-25T14:32:00",
+        "location": {"latitude": 12.5, "longitude": 77.5}
+    }
+
+
+def test_simple_cache_get_set_delete():
+    """SimpleCache should store, return and delete values."""
+    cache = SimpleCache()
+    cache.set("key", {"value": 1})
+
+    assert cache.get("key") == {"value": 1}
+    assert cache.size() == 1
+
+    cache.delete("key")
+    cache.delete("missing")
+    assert cache.get("key") is None
+    assert cache.size() == 0
+
+
+def test_simple_cache_expires_entries():
+    """SimpleCache should drop entries once their TTL has passed."""
+    cache = SimpleCache()
+    with patch("app.utils.cache.time.monotonic", return_value=1000.0):
+        cache.set("key", "value", ttl_seconds=60)
+
+    with patch("app.utils.cache.time.monotonic", return_value=1059.0):
+        assert cache.get("key") == "value"
+
+    with patch("app.utils.cache.time.monotonic", return_value=1061.0):
+        assert cache.get("key") is None
+    assert cache.size() == 0
+
+
+@pytest.mark.parametrize("is_valid_email", [email_helpers.is_valid_email, validators.is_valid_email])
+def test_is_valid_email(is_valid_email):
+    """Email validators should match the whole string."""
+    assert is_valid_email("user@example.com") is True
+    assert is_valid_email("first.last+tag@sub.example.org") is True
+    assert is_valid_email("") is False
+    assert is_valid_email("not-an-email") is False
+    assert is_valid_email("user@example.com\n") is False
+
+
+def test_is_valid_username():
+    """Usernames should be 3-30 word characters."""
+    assert validators.is_valid_username("john_doe99") is True
+    assert validators.is_valid_username("ab") is False
+    assert validators.is_valid_username("john doe") is False
+    assert validators.is_valid_username("john\n") is False
+
+
+def test_is_recent_handles_naive_and_aware_datetimes():
+    """is_recent should treat naive values as UTC and honour aware offsets."""
+    now = datetime.now(timezone.utc)
+
+    assert date_helpers.is_recent(now - timedelta(minutes=1))
+    assert date_helpers.is_recent((now - timedelta(minutes=1)).replace(tzinfo=None))
+    assert date_helpers.is_recent(now.astimezone(timezone(timedelta(hours=5, minutes=30))))
+    assert not date_helpers.is_recent(now - timedelta(minutes=10))
+    assert not date_helpers.is_recent(now + timedelta(minutes=1))
+
+
+def test_json_helpers_round_trip_mongo_types():
+    """json_serialize should encode ObjectIds and datetimes; json_deserialize reads str or bytes."""
+    object_id = ObjectId()
+    payload = {"_id": object_id, "created_at": datetime(2026, 1, 25, 14, 32)}
+
+    encoded = json_helpers.json_serialize(payload)
+
+    assert encoded == f'{{"_id":"{object_id}","created_at":"2026-01-25T14:32:00"}}'
+    assert json_helpers.json_deserialize(encoded) == json_helpers.json_deserialize(encoded.encode())
+    with pytest.raises(TypeError):
+        json_helpers.json_serialize({"value": object()})
+
+
+def test_success_response_renders_datetimes_and_models():
+    """success_response should render payloads the stdlib encoder rejects."""
+    response = success_response(data={
+        "joined_at": datetime(2026, 1, 25, 14, 32),
+        "location": LocationData(latitude=12.5, longitude=77.5)
+    })
+
+    assert isinstance(response, ORJSONResponse)
+    assert json.loads(response.body)["data"] == {
+        "joined_at": "2026-01-25T14:32:00",
+        "location": {"latitude": 12.5, "longitude": 77.5}
+    }
+
+
+def test_string_and_text_helpers():
+    """String and text helpers should keep their existing output."""
+    assert string_helpers.slugify("  Hello, World -- Again ") == "hello-world-again"
+    assert string_helpers.slugify("snake_case & more!") == "snake_case-more"
+    assert string_helpers.slugify("Café — naïve\u00a0text") == "café-naïve-text"
+    assert string_helpers.camel_to_snake("userProfileHTTPResponse") == "user_profile_http_response"
+    assert string_helpers.snake_to_camel("location_required_flag") == "locationRequiredFlag"
+    assert string_helpers.snake_to_camel("_private") == "Private"
+    assert string_helpers.mask_email("john.doe@mail.example.org") == "j******e@m***.example.org"
+    assert string_helpers.mask_email("ab@localhost") == "**@*********"
+    assert string_helpers.mask_email("not-an-email") == "not-an-email"
+    assert string_helpers.mask_emails(["john.doe@mail.example.org", "not-an-email"]) == [
+        "j******e@m***.example.org", "not-an-email"
+    ]
+    assert text_processing.extract_hashtags("#b #a #b") == ["b", "a"]
+    assert text_processing.extract_mentions("hi @bob and @bob") == ["bob"]
+    assert text_processing.clean_html(" <p>Hi <b>there</b></p> ") == "Hi there"
+    assert text_processing.clean_html("  no markup, 2 > 1  ") == "no markup, 2 > 1"
+    assert text_processing.reading_time("a few short words") == 1
+    assert text_processing.reading_time("word " * 700) == 4
+
+
+def test_whitespace_codepoints_match_regex_whitespace():
+    """The whitespace table should list exactly what regex \\s matches up to U+3000, its last match."""
+    matched = tuple(c for c in range(0x3001) if re.match(r"\s", chr(c)))
+
+    assert string_helpers._WHITESPACE_CODEPOINTS == matched
+
+
+def test_remove_whitespace_drops_all_whitespace():
+    """remove_whitespace should drop every listed whitespace character."""
+    whitespace = "".join(map(chr, string_helpers._WHITESPACE_CODEPOINTS))
+
+    assert string_helpers.remove_whitespace(f"a{whitespace}b c") == "abc"
+
+
+def _collection_returning(docs, count):
+    """Build a Motor collection mock whose find() cursor yields docs."""
+    cursor = MagicMock()
+    cursor.sort.return_value = cursor
+    cursor.skip.return_value = cursor
+    cursor.limit.return_value = cursor
+    cursor.batch_size.return_value = cursor
+    cursor.to_list = AsyncMock(return_value=docs)
+
+    collection = MagicMock()
+    collection.name = "posts"
+    collection.find.return_value = cursor
+    collection.count_documents = AsyncMock(return_value=count)
+    collection.estimated_document_count = AsyncMock(return_value=count)
+    return collection, cursor
+
+
+@pytest.fixture
+def empty_count_cache():
+    """Start and finish with an empty pagination count cache."""
+    pagination._count_cache.clear()
+    yield
+    pagination._count_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor_fetches_only_requested_page(empty_count_cache):
+    """paginate_cursor should push skip/limit to the database and count once."""
+    collection, cursor = _collection_returning([{"n": 21}, {"n": 22}], count=45)
+
+    result = await pagination.paginate_cursor(
+        collection, {"visibility": "public"}, page=2, page_size=20, sort=[("created_at", -1)]
+    )
+
+    cursor.skip.assert_called_once_with(20)
+    cursor.limit.assert_called_once_with(20)
+    collection.count_documents.assert_awaited_once_with({"visibility": "public"})
+    assert result["items"] == [{"n": 21}, {"n": 22}]
+    assert result["pagination"] == pagination.paginate(list(range(45)), 2, 20)["pagination"]
+
+
+@pytest.mark.asyncio
+async def test_paginate_cursor_uses_supplied_total():
+    """paginate_cursor should not count when the caller supplies a total."""
+    collection, _ = _collection_returning([], count=0)
+
+    result = await pagination.paginate_cursor(collection, {}, total_items=7)
+
+    collection.count_documents.assert_not_awaited()
+    assert result["pagination"]["total_items"] == 7
+
+
+@pytest.mark.asyncio
+async def test_cached_count_reuses_count_for_equivalent_filters(empty_count_cache):
+    """cached_count should count once per filter regardless of key order."""
+    collection, _ = _collection_returning([], count=12)
+
+    first = await pagination.cached_count(collection, {"a": 1, "b": ObjectId("507f1f77bcf86cd799439011")})
+    second = await pagination.cached_count(collection, {"b": ObjectId("507f1f77bcf86cd799439011"), "a": 1})
+
+    assert first == second == 12
+    collection.count_documents.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_count_keeps_objectid_and_str_filters_apart(empty_count_cache):
+    """cached_count should not serve a str filter the count of an equal-looking ObjectId filter."""
+    collection, _ = _collection_returning([], count=0)
+    collection.count_documents = AsyncMock(side_effect=[3, 0])
+    user_id = "507f1f77bcf86cd799439011"
+
+    assert await pagination.cached_count(collection, {"author.user_id": ObjectId(user_id)}) == 3
+    assert await pagination.cached_count(collection, {"author.user_id": user_id}) == 0
+    assert collection.count_documents.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_count_keeps_datetime_and_str_filters_apart(empty_count_cache):
+    """cached_count should key a datetime filter apart from its ISO string."""
+    collection, _ = _collection_returning([], count=0)
+    collection.count_documents = AsyncMock(side_effect=[4, 0])
+    since = datetime(2026, 1, 25, tzinfo=timezone.utc)
+
+    assert await pagination.cached_count(collection, {"created_at": {"$gte": since}}) == 4
+    assert await pagination.cached_count(collection, {"created_at": {"$gte": since.isoformat()}}) == 0
+    assert collection.count_documents.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_cached_count_uses_estimate_for_empty_filter(empty_count_cache):
+    """cached_count should use the metadata count when there is no filter."""
+    collection, _ = _collection_returning([], count=99)
+
+    assert await pagination.cached_count(collection, {}) == 99
+    collection.estimated_document_count.assert_awaited_once()
+    collection.count_documents.assert_not_awaited()
+
+
+def test_build_keyset_filter_seeks_in_sort_direction():
+    """build_keyset_filter should seek past after_id without touching the base filter."""
+    base = {"visibility": "public"}
+    after_id = ObjectId()
+
+    assert pagination.build_keyset_filter(base, None) is base
+    assert pagination.build_keyset_filter(base, after_id) == {"visibility": "public", "_id": {"$lt": after_id}}
+    assert pagination.build_keyset_filter(base, after_id, 1)["_id"] == {"$gt": after_id}
+    assert base == {"visibility": "public"}
+
+
+@pytest.mark.asyncio
+async def test_paginate_keyset_reports_next_cursor():
+    """paginate_keyset should trim the look-ahead document and expose the cursor."""
+    docs = [{"_id": ObjectId()} for _ in range(3)]
+    collection, cursor = _collection_returning(docs, count=0)
+
+    result = await pagination.paginate_keyset(collection, {}, limit=2)
+
+    cursor.limit.assert_called_once_with(3)
+    assert result["items"] == docs[:2]
+    assert result["pagination"] == {"limit": 2, "next_cursor": str(docs[1]["_id"]), "has_next": True}
+
+
+def test_timer_logs_duration_only_when_debug_enabled(caplog):
+    """Timer should log its duration at DEBUG and stay silent otherwise."""
+    with caplog.at_level(logging.INFO, logger="performance"):
+        with performance.Timer("quiet"):
+            pass
+    assert not caplog.records
+
+    with caplog.at_level(logging.DEBUG, logger="performance"):
+        with performance.Timer("loud"):
+            pass
+    assert caplog.records[0].getMessage().startswith("loud took ")
+
+
+def test_log_helpers_format_lazily(caplog):
+    """log_request and log_error should render the same messages as before."""
+    with caplog.at_level(logging.INFO):
+        logger.log_request("GET", "/api/posts", 200, 0.0123)
+        try:
+            raise ValueError("boom")
+        except ValueError as e:
+            logger.log_error(e, context="User signup")
+
+    messages = [record.getMessage() for record in caplog.records]
+    assert messages == ["GET /api/posts - 200 - 0.012s", "User signup - ValueError: boom"]
+
+
+@pytest.mark.asyncio
+async def test_measure_time_wraps_sync_and_async_functions():
+    """measure_time should keep sync functions sync and async functions awaitable."""
+    @performance.measure_time
+    def add(a, b):
+        return a + b
+
+    @performance.measure_time
+    async def add_async(a, b):
+        return a + b
+
+    assert add(1, 2) == 3
+    assert inspect.iscoroutinefunction(add_async)
+    assert await add_async(1, 2) == 3
+    assert add_async.__name__ == "add_async"
+
+
+@pytest.mark.asyncio
+async def test_stream_success_response_matches_success_response():
+    """stream_success_response should stream the same body success_response builds."""
+    docs = [{"_id": ObjectId(), "n": n} for n in range(3)]
+
+    async def cursor():
+        for doc in docs:
+            yield doc
+
+    response = stream_success_response(cursor(), message='Posts "retrieved"')
+    body = b"".join([chunk async for chunk in response.body_iterator])
+
+    assert json.loads(body) == json.loads(success_response(data=docs, message='Posts "retrieved"').body)